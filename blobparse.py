@@ -1,12 +1,250 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
-# pylint: disable=C0103,C0114
+# pylint: disable=C0103,C0114,C0116
 
+import argparse
+import glob
+import multiprocessing
+import os
+import sqlite3
+import struct
 import sys
+
+import logger
 import tblob
+import tcensus
+import tdiag
+
+#------------------------------------------------------------------------------
+
+STDIN = '-'
+# The stdin stream is a sequence of blobs, each one after its length.
+LENGTH_PREFIX = struct.Struct('<I')
+CHUNK_SIZE = 16
+# Keys range separator, the keys can be negative (e.g. secret chats mids).
+KEY_RANGE = '..'
+
+STATUS_PASSED = 'passed'
+STATUS_ISSUES = 'issues'
+STATUS_FAILED = 'failed'
+STATUSES = (STATUS_PASSED, STATUS_ISSUES, STATUS_FAILED)
+
+#------------------------------------------------------------------------------
+
+def read_stream(stream):
+    count = 0
+    while True:
+        header = stream.read(LENGTH_PREFIX.size)
+        if not header:
+            return
+        if len(header) != LENGTH_PREFIX.size:
+            raise ValueError('truncated length prefix after blob {}'.format(
+                count))
+        (length,) = LENGTH_PREFIX.unpack(header)
+        data = stream.read(length)
+        if len(data) != length:
+            raise ValueError('truncated blob {}'.format(count))
+        yield 'stdin#{}'.format(count), data
+        count += 1
+
+def input_files(path):
+    if os.path.isdir(path):
+        for root, directories, files in os.walk(path):
+            directories.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+    elif not os.path.exists(path) and glob.has_magic(path):
+        # Shells not expanding the globs, e.g. cmd.exe.
+        for filename in sorted(glob.glob(path, recursive=True)):
+            yield from input_files(filename)
+    else:
+        yield path
+
+def read_inputs(paths):
+    # (name, blob) of files, directories, globs and the stdin stream.
+    for path in paths:
+        if path == STDIN:
+            yield from read_stream(sys.stdin.buffer)
+            continue
+        for filename in input_files(path):
+            with open(filename, 'rb') as blob_file:
+                yield filename, blob_file.read()
+
+def parse_key(value):
+    # sent_files_v2 has text keys.
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def key_item(value):
+    # A key or an inclusive range first..last of integer keys (a text key
+    # can be a path with '..').
+    if KEY_RANGE in value:
+        first, last = (parse_key(key) for key in value.split(KEY_RANGE, 1))
+        if isinstance(first, int) and isinstance(last, int):
+            return first, last
+    key = parse_key(value)
+    return key, key
+
+def blob_columns(table):
+    return [column for blob_table, column in tcensus.BLOB_COLUMNS
+            if blob_table == table]
+
+def read_db(filename, table, keys, columns=None):
+    # (name, blob) of the rows, fetched by primary key. The table and the
+    # columns go in the SQL text: only the known ones.
+    key_column = tcensus.TABLE_KEYS[table]
+    unknown = set(columns or ()) - set(blob_columns(table))
+    if unknown:
+        raise ValueError('unknown blob column(s) of {}: {}'.format(
+            table, ', '.join(sorted(unknown))))
+    columns = columns or blob_columns(table)
+    db_uri = 'file:' + filename + '?mode=ro'
+    with sqlite3.connect(db_uri, uri=True) as db_connection:
+        db_connection.text_factory = bytes
+        db_cursor = db_connection.cursor()
+        for first, last in keys:
+            if first == last:
+                where, parameters = '{} = ?'.format(key_column), (first,)
+            else:
+                where = '{} BETWEEN ? AND ?'.format(key_column)
+                parameters = (first, last)
+            db_cursor.execute('SELECT {}, {} FROM {} WHERE {} ORDER BY 1'
+                              .format(key_column, ', '.join(columns), table,
+                                      where), parameters)
+            rows = db_cursor.fetchall()
+            if not rows:
+                print('{}: no rows with {} {}'.format(
+                    table, key_column, first if first == last else
+                    '{}{}{}'.format(first, KEY_RANGE, last)), file=sys.stderr)
+            for row in rows:
+                key = row[0].decode('utf-8', 'replace') if isinstance(
+                    row[0], bytes) else row[0]
+                for column, data in zip(columns, row[1:]):
+                    if data is not None:
+                        yield '{}.{} {}'.format(table, column, key), \
+                            bytes(data)
+
+#------------------------------------------------------------------------------
 
-with open(sys.argv[1], 'rb') as blob_file:
+# Each worker process has its own parser, built once.
+worker_parser = None
+
+def init_worker(dump):
+    global worker_parser # pylint: disable=W0603
+    worker_parser = (tblob.tblob(), dump)
+
+def parse_one(item):
+    blob_parser, dump = worker_parser
+    return parse_item(blob_parser, item, dump)
+
+def parse_item(blob_parser, item, dump=False):
+    # Returns name, status, blob name, issues [(signature, kind, name, size)]
+    # and the blob text when dumped.
+    name, data = item
+    before = {(entry.signature, entry.kind): entry.count
+              for entry in blob_parser.diagnostics.entries}
+    try:
+        blob = blob_parser.parse_blob(data, None, name)
+    except Exception as ee: # pylint: disable=W0703
+        return name, STATUS_FAILED, '{}: {}'.format(type(ee).__name__, ee), \
+            [], None
+    issues = [(entry.signature, entry.kind, entry.name, len(data))
+              for entry in blob_parser.diagnostics.entries
+              if entry.count != before.get((entry.signature, entry.kind), 0)]
+    if blob is None:
+        return name, STATUS_FAILED, None, issues, None
+    return (name, STATUS_ISSUES if issues else STATUS_PASSED,
+            blob.get('sname', '?'), issues, str(blob) if dump else None)
+
+def parse_all(items, jobs=None, dump=False):
+    # Results in the input order, from a process pool when jobs > 1.
+    if jobs == 1:
+        init_worker(dump)
+        yield from map(parse_one, items)
+        return
+    with multiprocessing.Pool(jobs, init_worker, (dump,)) as pool:
+        yield from pool.imap(parse_one, items, CHUNK_SIZE)
+
+#------------------------------------------------------------------------------
+
+def single(data, name=None):
     tparser = tblob.tblob()
-    blob = tparser.parse_blob(blob_file.read())
+    blob = tparser.parse_blob(data, None, name)
     print(blob)
+    if tparser.diagnostics:
+        print(tparser.diagnostics.summary(), file=sys.stderr)
+
+def batch(items, jobs=None, dump=False):
+    counts = dict.fromkeys(STATUSES, 0)
+    diagnostics = tdiag.tdiagnostics()
+    for name, status, sname, issues, text in parse_all(items, jobs, dump):
+        counts[status] += 1
+        for signature, kind, issue_name, size in issues:
+            diagnostics.add(None, signature, kind, issue_name, name, size)
+        print('{}: {} {}{}'.format(
+            name, status, sname or '',
+            ''.join(' [{}]'.format(issue[1]) for issue in issues)))
+        if text:
+            print(text)
+    print('{} blobs: {}'.format(sum(counts.values()), ', '.join(
+        '{} {}'.format(counts[status], status) for status in STATUSES)))
+    if diagnostics:
+        print(diagnostics.summary(), file=sys.stderr)
+    return counts[STATUS_PASSED] == sum(counts.values())
+
+#------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description='Telegram blobs parser: a single blob is printed, more '
+        'blobs are parsed in batch with a pass/fail summary')
+    parser.add_argument('inputs', nargs='*', metavar='input',
+                        help='blob file, directory, glob or - for a stream '
+                        'of length prefixed (uint32 little endian) blobs on '
+                        'stdin')
+    parser.add_argument('--db', help='cache4.db to read the blobs from, '
+                        'with --table and --key')
+    parser.add_argument('--table', choices=sorted(tcensus.TABLE_KEYS),
+                        help='table of the blobs')
+    parser.add_argument('--key', type=key_item, action='append',
+                        help='primary key (e.g. the message mid) or '
+                        'inclusive range FIRST{}LAST (repeatable)'.format(
+                            KEY_RANGE))
+    parser.add_argument('--column', action='append',
+                        help='blob column (default all the blob columns of '
+                        'the table)')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='parsing processes (default the CPUs count)')
+    parser.add_argument('-p', '--print', action='store_true', dest='dump',
+                        help='print the parsed blobs in batch mode')
+    parser.add_argument('-v', '--verbose', action='count',
+                        help='verbose level, e.g. -vvv')
+    args = parser.parse_args()
+    logger.configure_logging(args.verbose)
+
+    if args.db:
+        if args.inputs or not args.table or not args.key:
+            parser.error('--db needs --table and --key, and no inputs')
+        for column in args.column or ():
+            if column not in blob_columns(args.table):
+                parser.error('--column {} is not a blob column of {} '
+                             '(choose from {})'.format(
+                                 column, args.table,
+                                 ', '.join(blob_columns(args.table))))
+        blobs = list(read_db(args.db, args.table, args.key, args.column))
+    elif args.inputs:
+        blobs = read_inputs(args.inputs)
+        if (len(args.inputs) == 1 and os.path.isfile(args.inputs[0]) and
+                not args.jobs):
+            blobs = list(blobs)
+    else:
+        parser.error('no inputs and no --db')
+
+    if isinstance(blobs, list) and len(blobs) == 1 and not args.jobs:
+        single(blobs[0][1], blobs[0][0])
+    elif not batch(blobs, args.jobs, args.dump):
+        sys.exit(1)
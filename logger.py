@@ -13,6 +13,9 @@ info = _logger.info
 log = _logger.log
 warning = _logger.warning
 
+def debug_enabled():
+    return _logger.isEnabledFor(logging.DEBUG)
+
 def configure_logging(verbosity=None):
     for handler in logging.root.handlers:
         logging.root.removeHandler(handler)
@@ -0,0 +1,676 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, benchmarks.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Teleparser benchmarks.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import argparse
+import csv
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+import construct
+
+import logger
+import tblob
+import teleparser
+import toutput
+import tsynth
+
+#------------------------------------------------------------------------------
+
+# Constructor families of the blobs benchmark, each one with its own corpus.
+FAMILIES = ('messages', 'media', 'documents', 'photos', 'page_blocks',
+            'users', 'chats')
+
+# The blobs decoders to compare, name: factory.
+BACKENDS = {
+    'construct': tblob.tblob,
+}
+
+CORPUS_SEED = 0
+CORPUS_COUNT = 200
+REPEAT = 5
+
+# Scaling benchmark defaults: messages in the generated databases, shard
+# workers (0 is the single timeline) and output formats.
+SCALE_SIZES = (10000, 50000, 100000)
+SCALE_WORKERS = (0, 4)
+SCALE_FORMATS = (toutput.FORMAT_TEXT, toutput.FORMAT_JSONL,
+                 toutput.FORMAT_SQLITE)
+SCALE_FIELDS = ('messages', 'db_bytes', 'format', 'workers', 'compress',
+                'wall', 'cpu', 'peak_rss', 'first_output', 'output_bytes',
+                'messages_per_second')
+# Seconds between two checks of the output directory for the first output.
+FIRST_OUTPUT_POLL = 0.005
+PLOT_WIDTH = 50
+
+# Regression gate: the committed baseline and the relative drop of the
+# throughput and growth of the memory metrics that fail it. The memory
+# metrics are the same from run to run. The throughput moves with the
+# machine load, a single run up to 2x on a shared machine: the best of
+# COMPARE_RUNS runs is compared, and only a halved throughput (e.g. a
+# quadratic slowdown) fails by default.
+BASELINE_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'benchmarks', 'baseline_blobs.json')
+THROUGHPUT = 'throughput'
+MEMORY = 'memory'
+TOLERANCES = {THROUGHPUT: 0.50, MEMORY: 0.10}
+COMPARE_RUNS = 3
+# Compared metrics per benchmark, metric: kind.
+COMPARED_METRICS = {
+    'blobs': {'ops_per_second': THROUGHPUT, 'blocks_per_blob': MEMORY,
+              'peak_bytes': MEMORY},
+    'scale': {'messages_per_second': THROUGHPUT, 'peak_rss': MEMORY}}
+STATUS_OK = 'ok'
+STATUS_FAIL = 'FAIL'
+STATUS_MISSING = 'missing'
+
+#------------------------------------------------------------------------------
+
+def build_corpus(count=CORPUS_COUNT, seed=CORPUS_SEED):
+    # The same count and seed give the same blobs: {family: [blob, ...]}.
+    rnd = random.Random(seed)
+
+    def text(words_min=1, words_max=12):
+        return ' '.join(rnd.choice(tsynth.WORDS)
+                        for _ in range(rnd.randint(words_min, words_max)))
+
+    def rich_text():
+        parts = [tsynth.text_plain(text(1, 4)),
+                 tsynth.text_bold(tsynth.text_plain(text(1, 2))),
+                 tsynth.text_url(tsynth.text_plain(text(1, 2)),
+                                 'https://example.org/{}'.format(
+                                     rnd.randint(1, 1000)))]
+        return tsynth.text_concat(parts[:rnd.randint(1, 3)])
+
+    def media(index):
+        kind = index % 3
+        if kind == 0:
+            return tsynth.message_media_photo(index + 1, tsynth.BASE_EPOCH)
+        if kind == 1:
+            return tsynth.message_media_document(
+                index + 1, tsynth.BASE_EPOCH, 'application/pdf',
+                rnd.randint(1000, 1000000), 'file_{}.pdf'.format(index))
+        return tsynth.message_media_web_page(
+            index + 1, 'https://example.org/{}'.format(index), text(2, 5),
+            text(5, 20))
+
+    def message(index):
+        entities = None
+        if index % 4 == 0:
+            entities = [tsynth.message_entity(0, 3),
+                        tsynth.message_entity(0, 3, url=True)]
+        return tsynth.message(
+            index + 1, 100000 + index % 50, tsynth.peer_user(100001),
+            tsynth.BASE_EPOCH + index, text(),
+            media(index) if index % 2 else None,
+            tsynth.message_fwd_header(100002, tsynth.BASE_EPOCH)
+            if index % 5 == 0 else None, None, entities,
+            index if index % 3 == 0 else None, bool(index % 2))
+
+    def page_block(index):
+        kind = index % 4
+        if kind == 0:
+            return tsynth.page_block_title(tsynth.text_plain(text(1, 5)))
+        if kind == 1:
+            return tsynth.page_block_header(rich_text())
+        if kind == 2:
+            return tsynth.page_block_paragraph(rich_text())
+        return tsynth.page_block_list(
+            [rich_text() for _ in range(rnd.randint(1, 5))])
+
+    builders = {
+        'messages': message,
+        'media': media,
+        'documents': lambda index: tsynth.document(
+            index + 1, tsynth.BASE_EPOCH, 'video/mp4',
+            rnd.randint(1000, 1000000), 'video_{}.mp4'.format(index)),
+        'photos': lambda index: tsynth.photo(index + 1, tsynth.BASE_EPOCH),
+        'page_blocks': page_block,
+        'users': lambda index: tsynth.user(
+            100000 + index, 'first{}'.format(index),
+            'last{}'.format(index) if index % 3 else '',
+            'user{}'.format(index) if index % 2 else '',
+            '39{:010d}'.format(index) if index % 4 == 0 else '',
+            photo_id=index + 1 if index % 5 == 0 else None),
+        'chats': lambda index: tsynth.channel(
+            1000000 + index, 'channel {}'.format(text(1, 3)),
+            'chan{}'.format(index) if index % 2 else '', tsynth.BASE_EPOCH,
+            megagroup=bool(index % 3), participants=index + 2,
+            volume_id=index + 1 if index % 4 else None)}
+
+    return {family: [builders[family](index) for index in range(count)]
+            for family in FAMILIES}
+
+#------------------------------------------------------------------------------
+
+def bench_blobs(parser, blobs, repeat=REPEAT):
+    # Time: best of the repeated rounds over all the blobs. Memory: blocks
+    # still allocated per parsed blob (kept alive) and tracemalloc peak of
+    # the single parse.
+    assert blobs
+    size = sum(len(blob) for blob in blobs)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for blob in blobs:
+            parser.parse_blob(blob)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    # No collection while measuring the memory: a collection frees garbage
+    # left by whatever ran before, and when it runs depends on unrelated code.
+    gc.collect()
+    gc.disable()
+    try:
+        parsed = []
+        blocks = sys.getallocatedblocks()
+        for blob in blobs:
+            parsed.append(parser.parse_blob(blob))
+        # Only what the parsed blobs keep alive, not the parsing garbage.
+        gc.collect()
+        blocks = sys.getallocatedblocks() - blocks
+        del parsed
+        gc.collect()
+
+        peak = 0
+        tracemalloc.start()
+        for blob in blobs:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            parser.parse_blob(blob)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return {'blobs': len(blobs), 'bytes': size, 'seconds': round(best, 6),
+            'ops_per_second': round(len(blobs) / best, 1),
+            'ns_per_byte': round(best * 1e9 / size, 1),
+            'blocks_per_blob': round(blocks / len(blobs), 1),
+            'peak_bytes': peak}
+
+def run_blobs(backends=None, families=None, count=CORPUS_COUNT,
+              repeat=REPEAT):
+    corpus = build_corpus(count)
+    results = {}
+    for backend in backends or BACKENDS:
+        parser = BACKENDS[backend]()
+        results[backend] = {}
+        for family in families or FAMILIES:
+            results[backend][family] = bench_blobs(
+                parser, corpus[family], repeat)
+        if parser.diagnostics:
+            logger.warning('backend %s, corpus parsing issues:\n%s',
+                           backend, parser.diagnostics.summary())
+    return {'benchmark': 'blobs', 'environment': environment(),
+            'corpus': {'count': count, 'seed': CORPUS_SEED},
+            'repeat': repeat, 'results': results}
+
+def best_blobs(reports):
+    # The fastest run of each backend and family: the memory metrics do not
+    # change between the runs.
+    best = reports[0]
+    for report in reports[1:]:
+        for backend, families in report['results'].items():
+            for family, result in families.items():
+                if (result['ops_per_second'] >
+                        best['results'][backend][family]['ops_per_second']):
+                    best['results'][backend][family] = result
+    best['runs'] = len(reports)
+    return best
+
+def blobs_summary(report):
+    lines = ['{:<12} {:<12} {:>8} {:>12} {:>10} {:>12} {:>12}'.format(
+        'backend', 'family', 'blobs', 'ops/s', 'ns/byte', 'blocks/blob',
+        'peak bytes')]
+    for backend, families in report['results'].items():
+        for family, result in families.items():
+            lines.append(
+                '{:<12} {:<12} {:>8} {:>12.1f} {:>10.1f} {:>12.1f} {:>12}'
+                .format(backend, family, result['blobs'],
+                        result['ops_per_second'], result['ns_per_byte'],
+                        result['blocks_per_blob'], result['peak_bytes']))
+    return '\n'.join(lines)
+
+#------------------------------------------------------------------------------
+
+def directory_bytes(directory):
+    size = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            size += os.path.getsize(os.path.join(root, name))
+    return size
+
+def run_once(infilename, outdirectory, output_format, workers=0,
+             compress=None):
+    # A single teleparser.process run, meant to be in its own process for the
+    # peak RSS. The first output is when the output directory is not empty
+    # anymore, checked by a polling thread.
+    first_output = []
+    done = threading.Event()
+
+    def watch():
+        while not done.is_set():
+            if directory_bytes(outdirectory):
+                first_output.append(time.perf_counter())
+                return
+            done.wait(FIRST_OUTPUT_POLL)
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    start = time.perf_counter()
+    cpu = time.process_time()
+    watcher.start()
+    teleparser.process(infilename, outdirectory, output_format=output_format,
+                       compress=compress, shard_workers=workers)
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    done.set()
+    watcher.join()
+
+    peak_rss = None
+    if resource:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak_rss *= 1024
+    return {'wall': round(wall, 3), 'cpu': round(cpu, 3),
+            'peak_rss': peak_rss,
+            'first_output': round(first_output[0] - start, 3)
+                            if first_output else None,
+            'output_bytes': directory_bytes(outdirectory)}
+
+def generate_database(directory, messages):
+    filename = os.path.join(directory, 'cache4_{}.db'.format(messages))
+    if not os.path.exists(filename):
+        logger.warning('generating %s', filename)
+        tsynth.tsynth(messages).generate(filename)
+    return filename
+
+def run_scale(directory, sizes=SCALE_SIZES, workers=SCALE_WORKERS,
+              formats=SCALE_FORMATS, compress=None):
+    # pylint: disable=R0913
+    # The generated databases are kept in the directory for the next runs.
+    results = []
+    for messages in sizes:
+        infilename = generate_database(directory, messages)
+        for output_format in formats:
+            for shard_workers in workers:
+                if shard_workers and output_format == toutput.FORMAT_SQLITE:
+                    continue
+                outdirectory = tempfile.mkdtemp(dir=directory)
+                command = [sys.executable, os.path.abspath(__file__), 'run',
+                           infilename, outdirectory, '--format', output_format,
+                           '--workers', str(shard_workers)]
+                if compress:
+                    command.extend(('--compress', compress))
+                logger.warning('running %s', ' '.join(command[2:]))
+                try:
+                    output = subprocess.run(
+                        command, capture_output=True, check=True,
+                        text=True).stdout
+                finally:
+                    shutil.rmtree(outdirectory)
+                result = {'messages': messages,
+                          'db_bytes': os.path.getsize(infilename),
+                          'format': output_format, 'workers': shard_workers,
+                          'compress': compress or ''}
+                result.update(json.loads(output.splitlines()[-1]))
+                result['messages_per_second'] = round(
+                    messages / result['wall'], 1)
+                results.append(result)
+    return {'benchmark': 'scale', 'environment': environment(),
+            'results': results}
+
+def scale_summary(report):
+    lines = ['{:>10} {:>12} {:<7} {:>7} {:>9} {:>9} {:>11} {:>9} {:>12} '
+             '{:>10}'.format('messages', 'db bytes', 'format', 'workers',
+                             'wall (s)', 'cpu (s)', 'peak rss', 'first (s)',
+                             'output', 'msg/s')]
+    for result in report['results']:
+        lines.append('{:>10} {:>12} {:<7} {:>7} {:>9} {:>9} {:>11} {:>9} '
+                     '{:>12} {:>10}'.format(
+                         result['messages'], result['db_bytes'],
+                         result['format'], result['workers'], result['wall'],
+                         result['cpu'], str(result['peak_rss']),
+                         str(result['first_output']), result['output_bytes'],
+                         result['messages_per_second']))
+    return '\n'.join(lines)
+
+def scale_plot(report, key, width=PLOT_WIDTH):
+    # Text bars of a result key per run configuration and database size.
+    results = [result for result in report['results'] if result[key]]
+    if not results:
+        return ''
+    top = max(result[key] for result in results)
+    lines = ['{} (max {})'.format(key, top)]
+    for result in results:
+        label = '{:<6} w{:<2} {:>10}'.format(
+            result['format'], result['workers'], result['messages'])
+        bar = '#' * max(1, int(round(width * result[key] / top)))
+        lines.append('{} |{} {}'.format(label, bar, result[key]))
+    return '\n'.join(lines)
+
+def save_csv(report, filename, fields):
+    with open(filename, mode='w', encoding='utf-8', newline='') as fo:
+        writer = csv.DictWriter(fo, fields, extrasaction='ignore',
+                                lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(report['results'])
+
+#------------------------------------------------------------------------------
+
+def flatten_results(report):
+    # {benchmark key: result}, the key is 'backend/family' for the blobs and
+    # 'format/w<workers>/<messages>[/compress]' for the scale benchmark.
+    if report['benchmark'] == 'blobs':
+        return {'{}/{}'.format(backend, family): result
+                for backend, families in report['results'].items()
+                for family, result in families.items()}
+    flat = {}
+    for result in report['results']:
+        key = '{}/w{}/{}'.format(result['format'], result['workers'],
+                                 result['messages'])
+        if result['compress']:
+            key += '/' + result['compress']
+        flat[key] = result
+    return flat
+
+def tolerance(tolerances, key, kind):
+    # The most specific tolerance: the whole key, then any of its parts (e.g.
+    # the family), then the kind default.
+    for selector in [key] + key.split('/'):
+        if selector in tolerances and kind in tolerances[selector]:
+            return tolerances[selector][kind]
+    return tolerances.get(kind, TOLERANCES[kind])
+
+def compare_reports(baseline, current, tolerances=None):
+    assert baseline['benchmark'] == current['benchmark']
+    tolerances = dict(baseline.get('tolerances', {}), **(tolerances or {}))
+    metrics = COMPARED_METRICS[baseline['benchmark']]
+    current_results = flatten_results(current)
+    rows = []
+    for key, base in flatten_results(baseline).items():
+        result = current_results.get(key)
+        for metric, kind in metrics.items():
+            row = {'key': key, 'metric': metric, 'baseline': base.get(metric),
+                   'current': None, 'change': None,
+                   'tolerance': tolerance(tolerances, key, kind),
+                   'status': STATUS_MISSING}
+            rows.append(row)
+            if not result or result.get(metric) is None or not base.get(
+                    metric):
+                continue
+            row['current'] = result[metric]
+            row['change'] = result[metric] / base[metric] - 1.0
+            if kind == THROUGHPUT:
+                failed = row['change'] <= -row['tolerance']
+            else:
+                failed = row['change'] >= row['tolerance']
+            row['status'] = STATUS_FAIL if failed else STATUS_OK
+    return rows
+
+def compare_summary(rows):
+    lines = ['{:<32} {:<20} {:>14} {:>14} {:>8} {:>6} {:<7}'.format(
+        'benchmark', 'metric', 'baseline', 'current', 'change', 'tol',
+        'status')]
+    for row in rows:
+        change = ('{:+.1%}'.format(row['change']) if row['change'] is not None
+                  else '-')
+        lines.append('{:<32} {:<20} {:>14} {:>14} {:>8} {:>6.0%} {:<7}'.format(
+            row['key'], row['metric'], str(row['baseline']),
+            str(row['current']), change, row['tolerance'], row['status']))
+    failed = sum(1 for row in rows if row['status'] == STATUS_FAIL)
+    lines.append('{} regression(s) out of {} checks'.format(failed, len(rows)))
+    return '\n'.join(lines)
+
+#------------------------------------------------------------------------------
+
+def git_commit():
+    # The commit the benchmark runs on, if it's a git checkout.
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'), capture_output=True,
+            check=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment():
+    return {'date': datetime.datetime.utcnow().isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'construct': construct.version_string,
+            'machine': platform.machine(), 'system': platform.system()}
+
+def save_report(report, filename):
+    with open(filename, mode='w', encoding='utf-8') as fo:
+        json.dump(report, fo, indent=2)
+        fo.write('\n')
+
+#------------------------------------------------------------------------------
+
+def command_blobs(args):
+    report = run_blobs(args.backend, args.family, args.count, args.repeat)
+    print(blobs_summary(report))
+    if args.output:
+        save_report(report, args.output)
+
+def command_scale(args):
+    os.makedirs(args.directory, exist_ok=True)
+    report = run_scale(args.directory, args.sizes, args.workers,
+                       args.formats, args.compress)
+    print(scale_summary(report))
+    for key in ('wall', 'peak_rss', 'first_output'):
+        print()
+        print(scale_plot(report, key))
+    if args.output:
+        save_report(report, args.output)
+    if args.csv:
+        save_csv(report, args.csv, SCALE_FIELDS)
+
+def command_run(args):
+    print(json.dumps(run_once(args.infilename, args.outdirectory,
+                              args.format, args.workers, args.compress)))
+
+def command_compare(args):
+    with open(args.baseline, mode='r', encoding='utf-8') as fi:
+        baseline = json.load(fi)
+    if args.current:
+        with open(args.current, mode='r', encoding='utf-8') as fi:
+            current = json.load(fi)
+    elif baseline['benchmark'] == 'blobs':
+        # Same corpus and rounds of the baseline.
+        families = list(baseline['results'].values())[0].keys()
+        current = best_blobs([
+            run_blobs(list(baseline['results'].keys()), list(families),
+                      baseline['corpus']['count'], baseline['repeat'])
+            for _ in range(args.runs)])
+    else:
+        sys.exit('tbench: the {} benchmark is not run by compare, give its '
+                 'results file'.format(baseline['benchmark']))
+    if args.update:
+        current['tolerances'] = baseline.get('tolerances', {})
+        save_report(current, args.baseline)
+        logger.warning('baseline %s updated', args.baseline)
+        return
+    rows = compare_reports(baseline, current, args.tolerance)
+    print(compare_summary(rows))
+    if any(row['status'] == STATUS_FAIL for row in rows):
+        sys.exit(1)
+
+def tolerance_item(value):
+    # [benchmark:]kind=ratio, e.g. throughput=0.3 or messages:memory=0.2
+    try:
+        selector, ratio = value.split('=')
+        ratio = float(ratio)
+    except ValueError as ee:
+        raise argparse.ArgumentTypeError(
+            'bad tolerance {}'.format(value)) from ee
+    selector, _, kind = selector.rpartition(':')
+    if kind not in TOLERANCES:
+        raise argparse.ArgumentTypeError('unknown tolerance kind {}'.format(
+            kind))
+    return selector, kind, ratio
+
+class ttolerance_action(argparse.Action):
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        tolerances = getattr(namespace, self.dest) or {}
+        selector, kind, ratio = values
+        if selector:
+            tolerances.setdefault(selector, {})[kind] = ratio
+        else:
+            tolerances[kind] = ratio
+        setattr(namespace, self.dest, tolerances)
+
+def int_list(value):
+    return [int(item) for item in value.split(',')]
+
+def format_list(value):
+    formats = value.split(',')
+    for output_format in formats:
+        if output_format not in toutput.FORMATS:
+            raise argparse.ArgumentTypeError(
+                'unknown format {}'.format(output_format))
+    return formats
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Teleparser benchmarks')
+    parser.add_argument('-v', '--verbose', action='count',
+                        help='verbose level, -v to -vvv')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    blobs_parser = commands.add_parser(
+        'blobs', help='blobs decoding per constructor family')
+    blobs_parser.add_argument('-o', '--output', help='JSON results file')
+    blobs_parser.add_argument('--backend', action='append',
+                              choices=sorted(BACKENDS),
+                              help='decoder to benchmark, can be repeated '
+                              '(default all)')
+    blobs_parser.add_argument('--family', action='append', choices=FAMILIES,
+                              help='constructor family, can be repeated '
+                              '(default all)')
+    blobs_parser.add_argument('--count', type=int, default=CORPUS_COUNT,
+                              help='blobs per family (default {})'.format(
+                                  CORPUS_COUNT))
+    blobs_parser.add_argument('--repeat', type=int, default=REPEAT,
+                              help='timed rounds, the best one is kept '
+                              '(default {})'.format(REPEAT))
+    blobs_parser.set_defaults(function=command_blobs)
+
+    scale_parser = commands.add_parser(
+        'scale', help='full pipeline over generated databases of increasing '
+        'size, formats and workers')
+    scale_parser.add_argument('directory', help='working directory, the '
+                              'generated databases are kept there')
+    scale_parser.add_argument('-o', '--output', help='JSON results file')
+    scale_parser.add_argument('--csv', help='CSV results file')
+    scale_parser.add_argument('--sizes', type=int_list,
+                              default=SCALE_SIZES,
+                              help='messages of the generated databases, '
+                              'comma separated (default {})'.format(
+                                  ','.join(map(str, SCALE_SIZES))))
+    scale_parser.add_argument('--workers', type=int_list,
+                              default=SCALE_WORKERS,
+                              help='shard workers, 0 is no sharding, comma '
+                              'separated (default {})'.format(
+                                  ','.join(map(str, SCALE_WORKERS))))
+    scale_parser.add_argument('--formats', type=format_list,
+                              default=SCALE_FORMATS,
+                              help='output formats, comma separated '
+                              '(default {})'.format(','.join(SCALE_FORMATS)))
+    scale_parser.add_argument('-z', '--compress',
+                              choices=toutput.COMPRESSIONS,
+                              help='compress the outputs')
+    scale_parser.set_defaults(function=command_scale)
+
+    compare_parser = commands.add_parser(
+        'compare', help='regression gate, exit code 1 when the results are '
+        'worse than the baseline beyond the tolerances')
+    compare_parser.add_argument('current', nargs='?',
+                                help='JSON results file (default: run the '
+                                'blobs benchmark now)')
+    compare_parser.add_argument('-b', '--baseline', default=BASELINE_FILENAME,
+                                help='baseline JSON results file (default '
+                                '{})'.format(os.path.relpath(
+                                    BASELINE_FILENAME)))
+    compare_parser.add_argument('-t', '--tolerance', type=tolerance_item,
+                                action=ttolerance_action,
+                                metavar='[BENCHMARK:]KIND=RATIO',
+                                help='allowed relative drop of the throughput '
+                                'or growth of the memory, KIND is {}; '
+                                'BENCHMARK restricts it to a family, backend '
+                                'or key (default {})'.format(
+                                    ' or '.join(TOLERANCES), ', '.join(
+                                        '{}={}'.format(*item) for item
+                                        in TOLERANCES.items())))
+    compare_parser.add_argument('--runs', type=int, default=COMPARE_RUNS,
+                                help='blobs benchmark runs, the fastest one '
+                                'is compared (default {})'.format(
+                                    COMPARE_RUNS))
+    compare_parser.add_argument('--update', action='store_true',
+                                help='save the current results as the new '
+                                'baseline, keeping its tolerances')
+    compare_parser.set_defaults(function=command_compare)
+
+    run_parser = commands.add_parser(
+        'run', help='single timed teleparser run, JSON on stdout (used by '
+        'scale)')
+    run_parser.add_argument('infilename', help='input file cache4.db')
+    run_parser.add_argument('outdirectory', help='output directory')
+    run_parser.add_argument('--format', choices=toutput.FORMATS,
+                            default=toutput.FORMAT_TEXT)
+    run_parser.add_argument('--workers', type=int, default=0,
+                            help='shard workers, 0 is no sharding')
+    run_parser.add_argument('-z', '--compress', choices=toutput.COMPRESSIONS)
+    run_parser.set_defaults(function=command_run)
+
+    args = parser.parse_args()
+    logger.configure_logging(args.verbose)
+    args.function(args)
@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, blobs signatures census.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Census of the blobs signatures, SQL only (no blob is decoded).'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import csv
+import sqlite3
+
+import logger
+
+#------------------------------------------------------------------------------
+
+CENSUS_FILENAME = 'census.csv'
+CENSUS_FIELDS = ('table', 'column', 'signature', 'name', 'status', 'count',
+                 'bytes')
+
+# The blob columns parsed by tdb.
+BLOB_COLUMNS = (
+    ('chats', 'data'),
+    ('enc_chats', 'data'),
+    ('media_v2', 'data'),
+    ('messages', 'data'),
+    ('messages', 'replydata'),
+    ('sent_files_v2', 'data'),
+    ('users', 'data'),
+    ('user_settings', 'info'))
+
+# The primary key of the tables with blobs.
+TABLE_KEYS = {
+    'chats': 'uid',
+    'enc_chats': 'uid',
+    'media_v2': 'mid',
+    'messages': 'mid',
+    'sent_files_v2': 'uid',
+    'users': 'uid',
+    'user_settings': 'uid'}
+
+STATUS_SUPPORTED = 'supported'
+STATUS_NOT_SUPPORTED = 'not_supported'
+STATUS_UNKNOWN = 'unknown'
+STATUSES = (STATUS_SUPPORTED, STATUS_NOT_SUPPORTED, STATUS_UNKNOWN)
+
+#------------------------------------------------------------------------------
+
+class tcensus():
+
+    def __init__(self, sqlite_db_cursor, callbacks):
+        assert sqlite_db_cursor
+        self._sqlite_db_cursor = sqlite_db_cursor
+        self._callbacks = callbacks
+        self._rows = []
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def signature_status(self, signature):
+        if signature not in self._callbacks:
+            return '?', STATUS_UNKNOWN
+        # Some entries have no beautify.
+        blob_parser, name = self._callbacks[signature][:2]
+        if blob_parser:
+            return name, STATUS_SUPPORTED
+        return name, STATUS_NOT_SUPPORTED
+
+    def run(self):
+        self._rows = []
+        for table, column in BLOB_COLUMNS:
+            query = ('SELECT substr({0}, 1, 4), count(*), sum(length({0})) '
+                     'FROM {1} WHERE {0} IS NOT NULL GROUP BY 1 '
+                     'ORDER BY 2 DESC').format(column, table)
+            try:
+                self._sqlite_db_cursor.execute(query)
+            except sqlite3.OperationalError as ee:
+                # Tables and columns depend on the Telegram version.
+                logger.warning('census of %s.%s skipped: %s',
+                               table, column, str(ee))
+                continue
+            for prefix, count, size in self._sqlite_db_cursor.fetchall():
+                signature = int.from_bytes(bytes(prefix), 'little')
+                name, status = self.signature_status(signature)
+                self._rows.append({
+                    'table': table, 'column': column,
+                    'signature': '0x{:08x}'.format(signature), 'name': name,
+                    'status': status, 'count': count, 'bytes': size})
+        return self._rows
+
+    def save(self, filename):
+        with open(filename, mode='w', encoding='utf-8', newline='') as fo:
+            writer = csv.DictWriter(fo, CENSUS_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self._rows)
+
+    def summary(self):
+        # Rows and bytes per table and status: the bytes of the supported
+        # signatures estimate the decoding work.
+        totals = {}
+        for row in self._rows:
+            key = '{}.{}'.format(row['table'], row['column'])
+            table = totals.setdefault(key, {status: [0, 0]
+                                            for status in STATUSES})
+            table[row['status']][0] += row['count']
+            table[row['status']][1] += row['bytes']
+        lines = ['{:<24} {:>26} {:>26} {:>26}'.format(
+            'column', 'supported rows/bytes', 'not supported rows/bytes',
+            'unknown rows/bytes')]
+        for key, table in totals.items():
+            lines.append('{:<24} {:>26} {:>26} {:>26}'.format(
+                key, *('{}/{}'.format(*table[status]) for status in STATUSES)))
+        missing = [row for row in self._rows if row['status'] !=
+                   STATUS_SUPPORTED]
+        for row in missing:
+            lines.append('{}.{}: {} {} ({}) rows: {}'.format(
+                row['table'], row['column'], row['status'], row['signature'],
+                row['name'], row['count']))
+        return '\n'.join(lines)
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, daemon client.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Command line client of the parsing daemon (tdaemon.py). Standard library
+only, to start fast.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import argparse
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+#------------------------------------------------------------------------------
+
+# The daemon listens on localhost only.
+DAEMON_HOST = '127.0.0.1'
+DAEMON_PORT = 8740
+# Seconds a submit --wait waits for the job.
+WAIT = 3600
+
+#------------------------------------------------------------------------------
+
+def call(method, path, body=None, port=DAEMON_PORT):
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    request = urllib.request.Request(
+        'http://{}:{}{}'.format(DAEMON_HOST, port, path), data=data,
+        method=method, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as ee:
+        return json.loads(ee.read())
+
+def submit(job, port=DAEMON_PORT, wait=None):
+    # The job status, after the job is finished when waiting.
+    status = call('POST', '/jobs', job, port)
+    if wait and 'id' in status:
+        status = call('GET', '/jobs/{}?wait={}'.format(status['id'], wait),
+                      port=port)
+    return status
+
+#------------------------------------------------------------------------------
+
+def job_from_args(args):
+    # The paths are made absolute: the daemon runs in its own directory.
+    # The globs too, they are expanded by the daemon.
+    if args.kind == 'process':
+        return {'kind': 'process',
+                'infilename': os.path.abspath(args.infilename),
+                'outdirectory': os.path.abspath(args.outdirectory),
+                'options': {'output_format': args.format,
+                            'compress': args.compress}}
+    if args.kind == 'message':
+        return {'kind': 'message',
+                'infilename': os.path.abspath(args.infilename),
+                'mid': args.mid}
+    job = {'kind': 'blobs', 'print': args.print}
+    if args.db:
+        job.update({'db': os.path.abspath(args.db), 'table': args.table,
+                    'keys': args.key})
+    else:
+        job['paths'] = [os.path.abspath(path) for path in args.paths]
+    return job
+
+def print_json(value):
+    print(json.dumps(value, indent=2, ensure_ascii=False))
+
+#------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Parsing daemon client')
+    parser.add_argument('--port', type=int, default=DAEMON_PORT,
+                        help='daemon port (default {})'.format(DAEMON_PORT))
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit_parser = commands.add_parser('submit', help='submit a job')
+    submit_parser.add_argument('-w', '--wait', action='store_const',
+                               const=WAIT, help='wait for the job result')
+    kinds = submit_parser.add_subparsers(dest='kind', required=True)
+
+    process_parser = kinds.add_parser('process', help='full cache4.db run')
+    process_parser.add_argument('infilename', help='input file cache4.db')
+    process_parser.add_argument('outdirectory',
+                                help='output directory, must exist')
+    process_parser.add_argument('--format', default='text',
+                                help='output format (default text)')
+    process_parser.add_argument('-z', '--compress', help='compress outputs')
+
+    blobs_parser = kinds.add_parser('blobs', help='blobs parsing')
+    blobs_parser.add_argument('paths', nargs='*',
+                              help='blob files, directories or globs')
+    blobs_parser.add_argument('--db', help='cache4.db to read the blobs from')
+    blobs_parser.add_argument('--table', help='table of the blobs')
+    blobs_parser.add_argument('--key', action='append',
+                              help='primary key or FIRST..LAST range')
+    blobs_parser.add_argument('-p', '--print', action='store_true',
+                              help='return the parsed blobs too')
+
+    message_parser = kinds.add_parser('message',
+                                      help='a single message timeline row')
+    message_parser.add_argument('infilename', help='input file cache4.db')
+    message_parser.add_argument('mid', type=int, help='message mid')
+
+    status_parser = commands.add_parser('status',
+                                        help='daemon or job status')
+    status_parser.add_argument('job', nargs='?', type=int, help='job id')
+
+    commands.add_parser('jobs', help='status of all the jobs')
+    commands.add_parser('stop', help='stop the daemon')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'submit':
+            result = submit(job_from_args(args), args.port, args.wait)
+        elif args.command == 'status' and args.job:
+            result = call('GET', '/jobs/{}'.format(args.job), port=args.port)
+        elif args.command == 'status':
+            result = call('GET', '/status', port=args.port)
+        elif args.command == 'jobs':
+            result = call('GET', '/jobs', port=args.port)
+        else:
+            result = call('POST', '/shutdown', {}, args.port)
+    except urllib.error.URLError as ee:
+        sys.exit('tclient: daemon not reachable: {}'.format(ee.reason))
+    print_json(result)
+    if 'error' in result:
+        sys.exit(1)
@@ -0,0 +1,428 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, blobs corpus capture and replay.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Blobs corpus: all the blobs of a cache4.db in one indexed file, optionally
+anonymized, and their bulk replay through the decoding backends.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import sys
+import time
+
+import logger
+import tbench
+import tcensus
+import tdb
+
+#------------------------------------------------------------------------------
+
+# File layout: magic, the records, the index (one record offset each) and the
+# footer with the index offset and the records count. Each record is its
+# header (table, column, key and data lengths) followed by the four values,
+# the key is text as in the sent_files_v2 table.
+CORPUS_MAGIC = b'TCORPUS1'
+RECORD_HEADER = struct.Struct('<HHHI')
+INDEX_ENTRY = struct.Struct('<Q')
+FOOTER = struct.Struct('<QQ8s')
+
+STATUS_PARSED = 'parsed'
+STATUS_ISSUES = 'issues'
+STATUS_UNPARSED = 'unparsed'
+
+FETCH_SIZE = 1000
+
+#------------------------------------------------------------------------------
+
+class trecord():
+
+    __slots__ = ('table', 'column', 'key', 'data')
+
+    def __init__(self, table, column, key, data):
+        self.table = table
+        self.column = column
+        self.key = key
+        self.data = data
+
+    @property
+    def signature(self):
+        return int.from_bytes(self.data[:4], 'little')
+
+#------------------------------------------------------------------------------
+
+class tcorpus_writer():
+
+    def __init__(self, filename):
+        self._fo = open(filename, mode='wb') # pylint: disable=R1732
+        self._fo.write(CORPUS_MAGIC)
+        self._offsets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def add(self, table, column, key, data):
+        values = [value.encode('utf-8') for value in (table, column, str(key))]
+        self._offsets.append(self._fo.tell())
+        self._fo.write(RECORD_HEADER.pack(*(len(value) for value in values),
+                                          len(data)))
+        for value in values:
+            self._fo.write(value)
+        self._fo.write(data)
+
+    def close(self):
+        if self._fo.closed:
+            return
+        index = self._fo.tell()
+        for offset in self._offsets:
+            self._fo.write(INDEX_ENTRY.pack(offset))
+        self._fo.write(FOOTER.pack(index, len(self._offsets), CORPUS_MAGIC))
+        self._fo.close()
+
+#------------------------------------------------------------------------------
+
+class tcorpus_reader():
+
+    def __init__(self, filename):
+        self._fi = open(filename, mode='rb') # pylint: disable=R1732
+        if self._fi.read(len(CORPUS_MAGIC)) != CORPUS_MAGIC:
+            raise ValueError('{} is not a blobs corpus'.format(filename))
+        self._fi.seek(-FOOTER.size, os.SEEK_END)
+        index, count, magic = FOOTER.unpack(self._fi.read(FOOTER.size))
+        if magic != CORPUS_MAGIC:
+            raise ValueError('{} is truncated'.format(filename))
+        self._fi.seek(index)
+        self._offsets = [offset for (offset,) in INDEX_ENTRY.iter_unpack(
+            self._fi.read(count * INDEX_ENTRY.size))]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, position):
+        return self.__read(self._offsets[position])
+
+    def __iter__(self):
+        for offset in self._offsets:
+            yield self.__read(offset)
+
+    def __read(self, offset):
+        self._fi.seek(offset)
+        lengths = RECORD_HEADER.unpack(self._fi.read(RECORD_HEADER.size))
+        table, column, key = (self._fi.read(length).decode('utf-8')
+                              for length in lengths[:3])
+        return trecord(table, column, key, self._fi.read(lengths[3]))
+
+    def close(self):
+        self._fi.close()
+
+#------------------------------------------------------------------------------
+
+def tstring_values(blob):
+    # The raw bytes of every TL string in a parsed blob.
+    if isinstance(blob, dict):
+        if blob.get('_sname') == 'tstring':
+            yield blob['_value']
+            return
+        for key, value in blob.items():
+            if key != '_io':
+                yield from tstring_values(value)
+    elif isinstance(blob, list):
+        for value in blob:
+            yield from tstring_values(value)
+
+def tleaves(blob, pseudonym=None):
+    # The parsed values in order, the strings by their raw bytes (through
+    # pseudonym when given), their decoded copy skipped.
+    if isinstance(blob, dict):
+        if blob.get('_sname') == 'tstring':
+            yield pseudonym(blob['_value']) if pseudonym else blob['_value']
+            return
+        for key, value in blob.items():
+            if key != '_io':
+                yield key
+                yield from tleaves(value, pseudonym)
+    elif isinstance(blob, list):
+        for value in blob:
+            yield from tleaves(value, pseudonym)
+    else:
+        yield blob
+
+def tstring_serialized(value):
+    if len(value) < 254:
+        return bytes((len(value),)) + value
+    return b'\xfe' + len(value).to_bytes(3, 'little') + value
+
+class tanonymizer():
+
+    # Every string payload is replaced by an ASCII pseudonym of the same
+    # length in bytes, so the blob layout is untouched. The pseudonym is a
+    # keyed hash of the string: the same string gets the same pseudonym in
+    # the whole corpus and the repetitions are kept.
+
+    def __init__(self, blob_parser, salt=None):
+        self._blob_parser = blob_parser
+        self._salt = salt.encode('utf-8') if salt else os.urandom(16)
+
+    def pseudonym(self, value):
+        digest = hashlib.blake2b(value, key=self._salt).hexdigest().encode()
+        return (digest * (len(value) // len(digest) + 1))[:len(value)]
+
+    def anonymize(self, data, table=None, key=None):
+        # None when the blob is not fully parsed: its strings are unknown.
+        issues = len(self._blob_parser.diagnostics)
+        blob = self._blob_parser.parse_blob(data, table, key)
+        if blob is None or len(self._blob_parser.diagnostics) != issues:
+            return None
+        anonymized = data
+        for value in set(tstring_values(blob)):
+            if value:
+                anonymized = anonymized.replace(
+                    tstring_serialized(value),
+                    tstring_serialized(self.pseudonym(value)))
+        # The replacement is by bytes: a serialized string can be found in
+        # other fields too (ids, flags...). The anonymized blob must parse
+        # as the original one, with only its strings replaced.
+        reparsed = self._blob_parser.parse_blob(anonymized, table, key)
+        if (reparsed is None or
+                len(self._blob_parser.diagnostics) != issues or
+                list(tleaves(reparsed)) != list(tleaves(
+                    blob, self.pseudonym))):
+            logger.info('blob %s %s dropped, its anonymization changes the '
+                        'other fields', table, key)
+            return None
+        return anonymized
+
+#------------------------------------------------------------------------------
+
+def capture(sqlite_db_cursor, filename, tables=None, anonymizer=None):
+    # Returns the captured and the dropped (not anonymizable) blobs counts.
+    dropped = 0
+    with tcorpus_writer(filename) as writer:
+        for table, column in tcensus.BLOB_COLUMNS:
+            if tables and table not in tables:
+                continue
+            query = 'SELECT {0}, {1} FROM {2} WHERE {1} IS NOT NULL'.format(
+                tcensus.TABLE_KEYS[table], column, table)
+            try:
+                sqlite_db_cursor.execute(query)
+            except sqlite3.OperationalError as ee:
+                logger.warning('capture of %s.%s skipped: %s',
+                               table, column, str(ee))
+                continue
+            while True:
+                rows = sqlite_db_cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                for key, data in rows:
+                    key = tdb.to_text(key)
+                    data = bytes(data)
+                    if anonymizer:
+                        data = anonymizer.anonymize(data, table, key)
+                        if data is None:
+                            dropped += 1
+                            continue
+                    writer.add(table, column, key, data)
+        return len(writer), dropped
+
+def replay(reader, blob_parser, outputs=None):
+    # Parses all the records, returns {table.column: [blobs, bytes, seconds]}
+    # and, in outputs (when given), the status and digest of each output.
+    timings = {}
+    for position, record in enumerate(reader):
+        start = time.perf_counter()
+        issues = len(blob_parser.diagnostics)
+        blob = blob_parser.parse_blob(record.data, record.table, record.key)
+        elapsed = time.perf_counter() - start
+        timing = timings.setdefault(
+            '{}.{}'.format(record.table, record.column), [0, 0, 0.0])
+        timing[0] += 1
+        timing[1] += len(record.data)
+        timing[2] += elapsed
+        if outputs is None:
+            continue
+        if blob is None:
+            status, digest = STATUS_UNPARSED, None
+        else:
+            status = (STATUS_PARSED if len(blob_parser.diagnostics) == issues
+                      else STATUS_ISSUES)
+            digest = hashlib.sha1(str(blob).encode('utf-8')).hexdigest()
+        outputs.append({'record': position, 'table': record.table,
+                        'column': record.column, 'key': record.key,
+                        'signature': '0x{:08x}'.format(record.signature),
+                        'status': status, 'digest': digest})
+    return timings
+
+def replay_summary(backend, timings):
+    lines = ['{:<12} {:<24} {:>8} {:>12} {:>10} {:>12}'.format(
+        'backend', 'column', 'blobs', 'bytes', 'seconds', 'blobs/s')]
+    for name, (blobs, size, seconds) in sorted(timings.items()):
+        lines.append('{:<12} {:<24} {:>8} {:>12} {:>10.3f} {:>12.1f}'.format(
+            backend, name, blobs, size, seconds,
+            blobs / seconds if seconds else 0.0))
+    return '\n'.join(lines)
+
+def diff_outputs(reference, outputs):
+    # The records whose status or output changed.
+    differences = []
+    for before, after in zip(reference, outputs):
+        if (before['status'], before['digest']) != (after['status'],
+                                                    after['digest']):
+            differences.append((before, after))
+    if len(reference) != len(outputs):
+        logger.warning('outputs of %d and %d records, compared the first %d',
+                       len(reference), len(outputs),
+                       min(len(reference), len(outputs)))
+    return differences
+
+def load_outputs(filename):
+    with open(filename, mode='r', encoding='utf-8') as fi:
+        return [json.loads(line) for line in fi]
+
+def save_outputs(outputs, filename):
+    with open(filename, mode='w', encoding='utf-8') as fo:
+        for output in outputs:
+            fo.write(json.dumps(output) + '\n')
+
+#------------------------------------------------------------------------------
+
+def command_capture(args):
+    anonymizer = None
+    if args.anonymize:
+        anonymizer = tanonymizer(tbench.BACKENDS['construct'](), args.salt)
+    db_uri = 'file:' + args.infilename + '?mode=ro'
+    with sqlite3.connect(db_uri, uri=True) as db_connection:
+        db_connection.text_factory = bytes
+        captured, dropped = capture(db_connection.cursor(), args.outfilename,
+                                    args.table, anonymizer)
+    print('{} blobs captured in {}'.format(captured, args.outfilename))
+    if dropped:
+        print('{} blobs not anonymizable (not fully parsed or strings found '
+              'in other fields), dropped'.format(dropped))
+
+def command_info(args):
+    counts = {}
+    with tcorpus_reader(args.corpus) as reader:
+        for record in reader:
+            key = (record.table, record.column, record.signature)
+            count = counts.setdefault(key, [0, 0])
+            count[0] += 1
+            count[1] += len(record.data)
+        print('{} blobs'.format(len(reader)))
+    for (table, column, signature), (blobs, size) in sorted(counts.items()):
+        print('{}.{} 0x{:08x} {} blobs {} bytes'.format(
+            table, column, signature, blobs, size))
+
+def command_replay(args):
+    # The first backend is the reference of the others.
+    reference = load_outputs(args.against) if args.against else None
+    failed = False
+    with tcorpus_reader(args.corpus) as reader:
+        for backend in args.backend or ['construct']:
+            blob_parser = tbench.BACKENDS[backend]()
+            outputs = []
+            print(replay_summary(backend, replay(reader, blob_parser,
+                                                 outputs)))
+            if blob_parser.diagnostics:
+                print(blob_parser.diagnostics.summary(), file=sys.stderr)
+            if args.save and reference is None:
+                save_outputs(outputs, args.save)
+            if reference is None:
+                reference = outputs
+                continue
+            differences = diff_outputs(reference, outputs)
+            for before, after in differences:
+                print('{} {}.{} key {} {}: {} -> {}'.format(
+                    backend, after['table'], after['column'], after['key'],
+                    after['signature'], before['status'], after['status']))
+            print('{}: {} outputs differ'.format(backend, len(differences)))
+            failed = failed or bool(differences)
+    if failed:
+        sys.exit(1)
+
+#------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description='Blobs corpus capture and replay')
+    parser.add_argument('-v', '--verbose', action='count',
+                        help='verbose level, e.g. -vvv')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    capture_parser = commands.add_parser(
+        'capture', help='all the blobs of a cache4.db in a corpus file')
+    capture_parser.add_argument('infilename', help='input file cache4.db')
+    capture_parser.add_argument('outfilename',
+                                help='output corpus file, overwritten')
+    capture_parser.add_argument('--table', action='append',
+                                choices=sorted(tcensus.TABLE_KEYS),
+                                help='only this table (repeatable)')
+    capture_parser.add_argument('-a', '--anonymize', action='store_true',
+                                help='replace the strings with pseudonyms, '
+                                'the blobs not fully parsed are dropped')
+    capture_parser.add_argument('--salt', help='pseudonyms key, the same '
+                                'salt gives the same pseudonyms (default '
+                                'random)')
+    capture_parser.set_defaults(function=command_capture)
+
+    info_parser = commands.add_parser(
+        'info', help='blobs and bytes per column and signature')
+    info_parser.add_argument('corpus', help='corpus file')
+    info_parser.set_defaults(function=command_info)
+
+    replay_parser = commands.add_parser(
+        'replay', help='parse the whole corpus, timing and outputs diff')
+    replay_parser.add_argument('corpus', help='corpus file')
+    replay_parser.add_argument('--backend', action='append',
+                               choices=sorted(tbench.BACKENDS),
+                               help='decoding backend (repeatable, default '
+                               'construct), the first one is the reference')
+    replay_parser.add_argument('--save', help='save the outputs digests of '
+                               'the reference backend (JSON lines)')
+    replay_parser.add_argument('--against', help='outputs digests of a '
+                               'previous replay, the reference')
+    replay_parser.set_defaults(function=command_replay)
+
+    args = parser.parse_args()
+    logger.configure_logging(args.verbose)
+    args.function(args)
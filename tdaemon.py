@@ -0,0 +1,330 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, parsing daemon.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Parsing daemon: jobs over HTTP on localhost, run by a pool of worker
+processes which keep their parsers built between the jobs.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import argparse
+import collections
+import concurrent.futures
+import http.server
+import itertools
+import json
+import os
+import threading
+import time
+import urllib.parse
+
+import blobparse
+import logger
+import tblob
+import tclient
+import teleparser
+import tlookup
+import toutput
+
+#------------------------------------------------------------------------------
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+# Finished jobs kept for their status, the oldest ones are forgotten.
+KEEP_JOBS = 1000
+# Open databases kept by each worker for the message lookups.
+KEEP_LOOKUPS = 8
+
+# Web pages can reach localhost too (CSRF, DNS rebinding): only requests to
+# these host names, without an Origin and with JSON bodies are served.
+ALLOWED_HOSTS = ('127.0.0.1', 'localhost')
+JSON_CONTENT_TYPE = 'application/json'
+
+#------------------------------------------------------------------------------
+
+# Worker process state, built once by init_worker.
+worker_parser = None
+worker_lookups = collections.OrderedDict()
+
+def init_worker():
+    global worker_parser # pylint: disable=W0603
+    worker_parser = tblob.tblob()
+
+def job_process(job):
+    start = time.perf_counter()
+    if not os.path.isdir(job['outdirectory']):
+        raise ValueError('{} is not a directory'.format(job['outdirectory']))
+    teleparser.process(job['infilename'], job['outdirectory'],
+                       **job.get('options', {}))
+    return {'outdirectory': job['outdirectory'],
+            'seconds': round(time.perf_counter() - start, 3)}
+
+def job_blobs(job):
+    if job.get('db'):
+        items = blobparse.read_db(
+            job['db'], job['table'],
+            [blobparse.key_item(str(key)) for key in job['keys']],
+            job.get('columns'))
+    else:
+        items = blobparse.read_inputs(job['paths'])
+    blobs = []
+    counts = dict.fromkeys(blobparse.STATUSES, 0)
+    for item in items:
+        name, status, sname, issues, text = blobparse.parse_item(
+            worker_parser, item, job.get('print', False))
+        counts[status] += 1
+        blobs.append({'name': name, 'status': status, 'sname': sname,
+                      'issues': [issue[1] for issue in issues],
+                      'text': text})
+    return {'blobs': blobs, 'counts': counts}
+
+def job_message(job):
+    infilename = job['infilename']
+    lookup = worker_lookups.pop(infilename, None)
+    if not lookup:
+        lookup = tlookup.tlookup(infilename, blob_parser=worker_parser)
+    worker_lookups[infilename] = lookup
+    if len(worker_lookups) > KEEP_LOOKUPS:
+        worker_lookups.popitem(last=False)[1].close()
+    row = lookup.message_row(job['mid'])
+    if row is None:
+        raise KeyError('message {} not found'.format(job['mid']))
+    return toutput.to_json_value(row.to_dict())
+
+JOB_KINDS = {
+    'blobs': job_blobs,
+    'message': job_message,
+    'process': job_process}
+
+def run_job(job):
+    return JOB_KINDS[job['kind']](job)
+
+#------------------------------------------------------------------------------
+
+class tjob():
+
+    __slots__ = ('id', 'job', 'future', 'submitted', 'finished')
+
+    def __init__(self, job_id, job, future):
+        self.id = job_id
+        self.job = job
+        self.future = future
+        self.submitted = time.time()
+        self.finished = None
+        future.add_done_callback(self.__done)
+
+    def __done(self, _):
+        self.finished = time.time()
+
+    @property
+    def status(self):
+        if self.future.done():
+            return STATUS_FAILED if self.future.exception() else STATUS_DONE
+        return STATUS_RUNNING if self.future.running() else STATUS_QUEUED
+
+    def to_dict(self, result=False):
+        status = {'id': self.id, 'kind': self.job['kind'],
+                  'status': self.status, 'submitted': self.submitted,
+                  'finished': self.finished}
+        if self.finished:
+            status['seconds'] = round(self.finished - self.submitted, 3)
+        if result and self.status == STATUS_FAILED:
+            exception = self.future.exception()
+            status['error'] = '{}: {}'.format(type(exception).__name__,
+                                              exception)
+        elif result and self.status == STATUS_DONE:
+            status['result'] = self.future.result()
+        return status
+
+#------------------------------------------------------------------------------
+
+class tdaemon():
+
+    def __init__(self, workers=None):
+        self._workers = workers if workers else os.cpu_count()
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            self._workers, initializer=init_worker)
+        # Start the workers now, the first jobs find them warm.
+        for _ in range(self._workers):
+            self._executor.submit(int)
+        self._jobs = collections.OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def submit(self, job):
+        if job.get('kind') not in JOB_KINDS:
+            raise ValueError('unknown job kind {}'.format(job.get('kind')))
+        with self._lock:
+            job_id = next(self._ids)
+            self._jobs[job_id] = tjob(job_id, job,
+                                      self._executor.submit(run_job, job))
+            self.__forget()
+            return self._jobs[job_id]
+
+    def __forget(self):
+        finished = [job_id for job_id, job in self._jobs.items()
+                    if job.finished]
+        for job_id in finished[:max(0, len(finished) - KEEP_JOBS)]:
+            del self._jobs[job_id]
+
+    def job(self, job_id, wait=None):
+        job = self._jobs.get(job_id)
+        if job and wait:
+            concurrent.futures.wait((job.future,), wait)
+        return job
+
+    def jobs(self):
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def status(self):
+        with self._lock:
+            statuses = collections.Counter(
+                job.status for job in self._jobs.values())
+        return {'pid': os.getpid(), 'workers': self._workers,
+                'uptime': round(time.time() - self._started, 1),
+                'jobs': dict(statuses)}
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
+#------------------------------------------------------------------------------
+
+class thandler(http.server.BaseHTTPRequestHandler):
+
+    # GET /status, GET /jobs, GET /jobs/<id>[?wait=seconds], POST /jobs (the
+    # job as JSON) and POST /shutdown. Replies are JSON.
+
+    def do_GET(self):
+        if self.__refused():
+            return
+        url = urllib.parse.urlsplit(self.path)
+        daemon = self.server.tdaemon
+        if url.path == '/status':
+            self.__reply(200, daemon.status())
+        elif url.path == '/jobs':
+            self.__reply(200, daemon.jobs())
+        elif url.path.startswith('/jobs/'):
+            query = urllib.parse.parse_qs(url.query)
+            try:
+                job = daemon.job(int(url.path[len('/jobs/'):]),
+                                 float(query.get('wait', [0])[0]))
+            except ValueError:
+                job = None
+            if job:
+                self.__reply(200, job.to_dict(result=True))
+            else:
+                self.__reply(404, {'error': 'unknown job'})
+        else:
+            self.__reply(404, {'error': 'unknown path'})
+
+    def do_POST(self):
+        if self.__refused(JSON_CONTENT_TYPE):
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self.__reply(400, {'error': 'the body is not JSON'})
+            return
+        if self.path == '/jobs':
+            try:
+                job = self.server.tdaemon.submit(body)
+            except ValueError as ee:
+                self.__reply(400, {'error': str(ee)})
+                return
+            self.__reply(201, job.to_dict())
+        elif self.path == '/shutdown':
+            self.__reply(200, {'status': 'stopping'})
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            self.__reply(404, {'error': 'unknown path'})
+
+    def __refused(self, content_type=None):
+        # Browsers always send the Host, and the Origin on cross-site and
+        # POST requests: the daemon clients never send an Origin.
+        port = self.server.server_address[1]
+        if self.headers.get('Host') not in {
+                '{}:{}'.format(host, port) for host in ALLOWED_HOSTS}:
+            self.__reply(403, {'error': 'host not allowed'})
+        elif 'Origin' in self.headers:
+            self.__reply(403, {'error': 'cross origin requests not allowed'})
+        elif content_type and self.headers.get_content_type() != content_type:
+            self.__reply(415, {'error': 'the body must be {}'.format(
+                content_type)})
+        else:
+            return False
+        return True
+
+    def __reply(self, code, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args): # pylint: disable=W0622
+        logger.info('%s %s', self.address_string(), format % args)
+
+#------------------------------------------------------------------------------
+
+def serve(port=tclient.DAEMON_PORT, workers=None):
+    daemon = tdaemon(workers)
+    server = http.server.ThreadingHTTPServer((tclient.DAEMON_HOST, port),
+                                             thandler)
+    server.tdaemon = daemon
+    logger.warning('listening on %s:%d, %d workers', tclient.DAEMON_HOST,
+                   port, daemon.status()['workers'])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.shutdown()
+
+#------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description='Teleparser daemon, jobs over HTTP on localhost')
+    parser.add_argument('--port', type=int, default=tclient.DAEMON_PORT,
+                        help='listening port (default {})'.format(
+                            tclient.DAEMON_PORT))
+    parser.add_argument('-j', '--workers', type=int,
+                        help='worker processes (default the CPUs count)')
+    parser.add_argument('-v', '--verbose', action='count',
+                        help='verbose level, e.g. -vvv')
+    args = parser.parse_args()
+    logger.configure_logging(args.verbose)
+
+    serve(args.port, args.workers)
@@ -29,14 +29,26 @@
 
 # pylint: disable=C0103,C0115,C0116,C0302,R0902,R0914,R0913
 
+import collections
+import copy
+import csv
 import datetime
 import os
 
 import logger
+import tmetrics
+import toutdb
+import toutput
 
 #------------------------------------------------------------------------------
 
 CSV_SEPARATOR = ','
+FETCH_SIZE = 1000
+# Objects kept by each table of the random access lookups.
+LOOKUP_CACHE_SIZE = 1024
+SHARDS_DIRECTORY = 'dialogs'
+SHARDS_INDEX = 'index.csv'
+SHARD_GLOBAL = 'global'
 TYPE_CHAT_CREATION_DATE = 'chat_creation_date'
 TYPE_CHAT_LAST_UPDATE = 'chat_last_update'
 TYPE_MSG_SERVICE = 'service'
@@ -47,11 +59,21 @@ TYPE_USER_STATUS_UPDATE = 'user_status_update'
 
 #------------------------------------------------------------------------------
 
-def escape_csv_string(instr):
-    if instr:
-        instr = instr.strip('"\'')
-        return '"{}"'.format(instr.replace('"', '\''))
-    return ''
+def to_text(value):
+    # The source db is opened with text_factory=bytes.
+    if isinstance(value, bytes):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            return value
+    return value
+
+def dialog_to_chat_id(did):
+    if did.bit_length() > 32:
+        return did >> 32
+    if did < 0:
+        return -1 * did
+    return did
 
 def to_date(epoch):
     if epoch:
@@ -60,10 +82,51 @@ def to_date(epoch):
 
 #------------------------------------------------------------------------------
 
+class tlookup_table():
+
+    # A table read on demand: an indexed SELECT by primary key for each key
+    # not in the cache, which keeps the last cache_size objects used (missing
+    # keys included). It has the dict methods the timeline code uses.
+
+    def __init__(self, sqlite_db_cursor, table, key_column, from_entry,
+                 cache_size=LOOKUP_CACHE_SIZE):
+        # pylint: disable=R0913
+        # A cursor of its own, not to break a fetch going on in the caller.
+        self._sqlite_db_cursor = sqlite_db_cursor.connection.cursor()
+        self._query = 'SELECT * from {} WHERE {} = ?'.format(table, key_column)
+        self._from_entry = from_entry
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict()
+
+    def get(self, key, default=None):
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            value = self._cache[key]
+        else:
+            self._sqlite_db_cursor.execute(self._query, (key,))
+            entry = self._sqlite_db_cursor.fetchone()
+            value = self._from_entry(entry) if entry else None
+            self._cache[key] = value
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return default if value is None else value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+#------------------------------------------------------------------------------
+
 class tdb():
 
-    def __init__(self, outdirectory, blob_parser, sqlite_db_cursor):
-        assert outdirectory
+    def __init__(self, outdirectory, blob_parser, sqlite_db_cursor,
+                 hunter=None, compress=None, metrics=None, progress=None):
+        # The outdirectory is None when nothing is saved (lookups).
         self._outdirectory = outdirectory
         assert blob_parser
         self._blob_parser = blob_parser
@@ -79,42 +142,111 @@ class tdb():
         self._table_sent_files = {}
         self._table_users = {}
         self._table_user_settings = {}
+        # Tables already in the _table_* dicts, by parse() or iter_timeline().
+        self._parsed_tables = set()
+        self._hunter = hunter
+        self._compress = compress
+        self._metrics = metrics if metrics else tmetrics.tmetrics()
+        # The phases are always timed (cheap), the bytes read are summed on
+        # every row: only when the caller asks for the metrics.
+        self._count_bytes = metrics is not None
+        self._progress = progress
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    def __select(self, table, cursor=None):
+        # The query runs now (errors are raised to the caller), the rows are
+        # fetched in batches and accounted to the current metrics phase.
+        cursor = cursor if cursor else self._sqlite_db_cursor
+        if self._progress:
+            # max(rowid) would be cheaper but it's the mid for messages.
+            cursor.execute('SELECT count(*) from {}'.format(table))
+            self._progress.start(table, cursor.fetchone()[0])
+        cursor.execute('SELECT * from {}'.format(table))
+        return self.__fetch_rows(cursor, self._metrics.current)
+
+    def __fetch_rows(self, cursor, phase):
+        count_bytes = phase is not None and self._count_bytes
+        while True:
+            entries = cursor.fetchmany(FETCH_SIZE)
+            if not entries:
+                break
+            for entry in entries:
+                if phase:
+                    phase.rows += 1
+                if count_bytes:
+                    phase.bytes_read += sum(
+                        len(value) for value in entry
+                        if isinstance(value, bytes))
+                yield entry
+            if self._progress:
+                self._progress.update(len(entries))
+        if self._progress:
+            self._progress.finish()
+
+    def use_lookup_tables(self, cache_size=LOOKUP_CACHE_SIZE):
+        # Random access instead of parse() and iter_timeline(): the chats,
+        # secret chats and users needed to resolve the names are read on
+        # demand, by key.
+        self._table_chats = tlookup_table(
+            self._sqlite_db_cursor, 'chats', 'uid', self.chat_from_entry,
+            cache_size)
+        self._table_enc_chats = tlookup_table(
+            self._sqlite_db_cursor, 'enc_chats', 'uid',
+            self.enc_chat_from_entry, cache_size)
+        self._table_users = tlookup_table(
+            self._sqlite_db_cursor, 'users', 'uid', self.user_from_entry,
+            cache_size)
+
+    def select_entry(self, table, key_column, key):
+        # A single row by primary key, None if missing.
+        self._sqlite_db_cursor.execute(
+            'SELECT * from {} WHERE {} = ?'.format(table, key_column), (key,))
+        return self._sqlite_db_cursor.fetchone()
+
+    def chat_from_entry(self, entry):
+        uid = int(entry['uid'])
+        assert uid
+        blob = self._blob_parser.parse_blob(entry['data'], 'chats', uid)
+        return tchat(uid, entry['name'], blob)
 
     def __parse_table_chats(self):
-        self._sqlite_db_cursor.execute('SELECT * from chats')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('chats')
 
         for entry in entries:
-            uid = int(entry['uid'])
-            assert uid
-            assert uid not in self._table_chats
-            logger.info('parsing chats, entry uid: %s', uid)
-            blob = self._blob_parser.parse_blob(entry['data'])
-            chat = tchat(uid, entry['name'], blob)
-            self._table_chats[uid] = chat
+            chat = self.chat_from_entry(entry)
+            assert chat.uid not in self._table_chats
+            self._table_chats[chat.uid] = chat
 
     def __save_table_chats(self, outdir):
-        with open(os.path.join(outdir, 'table_chats.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_chats.txt'),
+                self._compress, newline=None) as fo:
             for uid, chat in self._table_chats.items():
                 fo.write('-' * 80)
                 fo.write('\nuid: {} name: {}\n\n'.format(uid, chat.name))
                 fo.write('{}\n\n'.format(chat.blob))
 
+    @staticmethod
+    def contact_from_entry(entry):
+        uid = int(entry['uid'])
+        assert uid
+        return {'uid': uid, 'mutual': int(entry['mutual'])}
+
     def __parse_table_contacts(self):
-        self._sqlite_db_cursor.execute('SELECT * from contacts')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('contacts')
 
         for entry in entries:
-            uid = int(entry['uid'])
-            assert uid
-            assert uid not in self._table_contacts
-            logger.info('parsing contacts, entry uid: %s', uid)
-            self._table_contacts[uid] = int(entry['mutual'])
+            contact = self.contact_from_entry(entry)
+            assert contact['uid'] not in self._table_contacts
+            self._table_contacts[contact['uid']] = contact['mutual']
 
     def __save_table_contacts(self, outdir):
-        with open(os.path.join(outdir, 'table_contacts.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_contacts.txt'),
+                self._compress, newline=None) as fo:
             for uid, mutual in self._table_contacts.items():
                 fo.write('-' * 80)
                 fo.write('\nuid: {} mutual: {}\n'.format(uid, mutual))
@@ -124,25 +256,28 @@ class tdb():
                 else:
                     fo.write('User uid missing in [users]\n')
 
+    @staticmethod
+    def dialog_from_entry(entry):
+        did = int(entry['did'])
+        assert did
+        return tdialog(
+            did, entry['date'], entry['unread_count'], entry['last_mid'],
+            entry['inbox_max'], entry['outbox_max'], entry['last_mid_i'],
+            entry['unread_count_i'], entry['pts'], entry['date_i'],
+            entry['pinned'], entry['flags'])
+
     def __parse_table_dialogs(self):
-        self._sqlite_db_cursor.execute('SELECT * from dialogs')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('dialogs')
 
         for entry in entries:
-            did = int(entry['did'])
-            assert did
-            assert did not in self._table_dialogs
-            logger.info('parsing dialogs, entry did: %s', did)
-            dialog = tdialog(
-                did, entry['date'], entry['unread_count'], entry['last_mid'],
-                entry['inbox_max'], entry['outbox_max'], entry['last_mid_i'],
-                entry['unread_count_i'], entry['pts'], entry['date_i'],
-                entry['pinned'], entry['flags'])
-            self._table_dialogs[did] = dialog
+            dialog = self.dialog_from_entry(entry)
+            assert dialog.did not in self._table_dialogs
+            self._table_dialogs[dialog.did] = dialog
 
     def __save_table_dialogs(self, outdir):
-        with open(os.path.join(outdir, 'table_dialogs.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_dialogs.txt'),
+                self._compress, newline=None) as fo:
             for did, dialog in self._table_dialogs.items():
                 fo.write('-' * 80)
                 date_string = to_date(dialog.date)
@@ -158,43 +293,46 @@ class tdb():
                         dialog.unread_count_i, dialog.pts, dialog.date_i,
                         dialog.pinned, dialog.flags))
 
+    def enc_chat_from_entry(self, entry):
+        uid = int(entry['uid'])
+        assert uid
+        # [20200408] Check if we have a blob of bytes.
+        if isinstance(entry['data'], bytes):
+            blob = self._blob_parser.parse_blob(
+                entry['data'], 'enc_chats', uid)
+        else:
+            blob = None
+            logger.error('enc_chats uid:%s blob is not made by bytes, '
+                         'skipping it', uid)
+
+        admin_id = getattr(blob, 'admin_id', None)
+        if admin_id:
+            assert entry['admin_id'] == admin_id
+        participant_id = getattr(blob, 'participant_id', None)
+        if participant_id:
+            if entry['user'] != entry['admin_id']:
+                assert entry['user'] == participant_id
+
+        return techat(entry['uid'], entry['user'], entry['name'], blob,
+                      entry['g'], entry['authkey'], entry['ttl'],
+                      entry['layer'], entry['seq_in'], entry['seq_out'],
+                      entry['use_count'], entry['exchange_id'],
+                      entry['key_date'], entry['fprint'],
+                      entry['fauthkey'], entry['khash'], entry['in_seq_no'],
+                      entry['admin_id'], entry['mtproto_seq'])
+
     def __parse_table_enc_chats(self):
-        self._sqlite_db_cursor.execute('SELECT * from enc_chats')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('enc_chats')
 
         for entry in entries:
             uid = int(entry['uid'])
-            assert uid
             assert uid not in self._table_enc_chats
-            logger.info('parsing enc_chats, entry uid: %s', uid)
-            # [20200408] Check if we have a blob of bytes.
-            if isinstance(entry['data'], bytes):
-                blob = self._blob_parser.parse_blob(entry['data'])
-            else:
-                blob = None
-                logger.error('enc_chats uid:%s blob is not made by bytes, '
-                             'skipping it', uid)
-
-            admin_id = getattr(blob, 'admin_id', None)
-            if admin_id:
-                assert entry['admin_id'] == admin_id
-            participant_id = getattr(blob, 'participant_id', None)
-            if participant_id:
-                if entry['user'] != entry['admin_id']:
-                    assert entry['user'] == participant_id
-
-            tec = techat(entry['uid'], entry['user'], entry['name'], blob,
-                         entry['g'], entry['authkey'], entry['ttl'],
-                         entry['layer'], entry['seq_in'], entry['seq_out'],
-                         entry['use_count'], entry['exchange_id'],
-                         entry['key_date'], entry['fprint'],
-                         entry['fauthkey'], entry['khash'], entry['in_seq_no'],
-                         entry['admin_id'], entry['mtproto_seq'])
-            self._table_enc_chats[uid] = tec
+            self._table_enc_chats[uid] = self.enc_chat_from_entry(entry)
 
     def __save_table_enc_chats(self, outdir):
-        with open(os.path.join(outdir, 'table_enc_chats.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_enc_chats.txt'),
+                self._compress, newline=None) as fo:
             for uid, tec in self._table_enc_chats.items():
                 assert uid == tec.uid
                 fo.write('-' * 80)
@@ -211,23 +349,24 @@ class tdb():
                         tec.admin_id, tec.mtproto_seq))
                 fo.write('\n{}\n\n'.format(tec.blob))
 
+    def media_from_entry(self, entry):
+        mid = int(entry['mid'])
+        assert mid
+        blob = self._blob_parser.parse_blob(entry['data'], 'media_v2', mid)
+        return tmedia(mid, entry['uid'], entry['date'], entry['type'], blob)
+
     def __parse_table_media_v2(self):
-        self._sqlite_db_cursor.execute('SELECT * from media_v2')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('media_v2')
 
         for entry in entries:
-            mid = int(entry['mid'])
-            assert mid
-            assert mid not in self._table_media
-            logger.info('parsing media_v2, entry mid: %s', mid)
-            blob = self._blob_parser.parse_blob(entry['data'])
-            media = tmedia(mid, entry['uid'], entry['date'],
-                           entry['type'], blob)
-            self._table_media[mid] = media
+            media = self.media_from_entry(entry)
+            assert media.mid not in self._table_media
+            self._table_media[media.mid] = media
 
     def __save_table_media_v2(self, outdir):
-        with open(os.path.join(outdir, 'table_media_v2.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_media_v2.txt'),
+                self._compress, newline=None) as fo:
             for mid, media in self._table_media.items():
                 fo.write('-' * 80)
                 date_string = to_date(media.date)
@@ -243,79 +382,88 @@ class tdb():
                     fo.write('User uid missing in [users]\n\n')
                 fo.write('{}\n\n'.format(media.blob))
 
+    def message_from_entry(self, entry):
+        mid = int(entry['mid'])
+        assert mid
+        blob = self._blob_parser.parse_blob(entry['data'], 'messages', mid)
+        replyblob = None
+        if entry['replydata']:
+            replyblob = self._blob_parser.parse_blob(
+                entry['replydata'], 'messages', mid)
+
+        message = tmessage(mid, entry['uid'], entry['read_state'],
+                           entry['send_state'], entry['date'], blob,
+                           entry['out'], entry['ttl'], entry['media'],
+                           replyblob, entry['imp'], entry['mention'])
+
+        # The difference should be less than 5 seconds.
+        date_from_blob = message.message_date_from_blob
+        if date_from_blob and date_from_blob != entry['date']:
+            if message.date and date_from_blob > message.date:
+                assert (date_from_blob - message.message_date_from_blob) < 5
+            else:
+                assert (message.message_date_from_blob - date_from_blob) < 5
+        return message
+
     def __parse_table_messages(self):
-        self._sqlite_db_cursor.execute('SELECT * from messages')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('messages')
 
         for entry in entries:
-            mid = int(entry['mid'])
-            assert mid
+            message = self.message_from_entry(entry)
+            mid = message.mid
             assert mid not in self._table_messages
-            logger.info('parsing messages, entry mid: %s', mid)
-            blob = self._blob_parser.parse_blob(entry['data'])
-            replyblob = None
-            if entry['replydata']:
-                replyblob = self._blob_parser.parse_blob(entry['replydata'])
-
-            message = tmessage(mid, entry['uid'], entry['read_state'],
-                               entry['send_state'], entry['date'], blob,
-                               entry['out'], entry['ttl'], entry['media'],
-                               replyblob, entry['imp'], entry['mention'])
-
-            # The difference should be less than 5 seconds.
-            date_from_blob = message.message_date_from_blob
-            if date_from_blob and date_from_blob != entry['date']:
-                if message.date and date_from_blob > message.date:
-                    assert (date_from_blob - message.message_date_from_blob) < 5
-                else:
-                    assert (message.message_date_from_blob - date_from_blob) < 5
+
+            if self._hunter:
+                dialog, _ = message.dialog_and_sequence
+                self._hunter.scan(mid, dialog, message.text_fields)
 
             self._table_messages[mid] = message
 
+    def __message_text(self, mid, tmsg):
+        text = '{}\nmid: {} uid: {} read_state: {} send_state: {} ' \
+            'date: {} out: {} ttl: {} media: {} imp: {} mention: {}\n'.format(
+                '-' * 80, mid, tmsg.uid, tmsg.read_state, tmsg.send_state,
+                tmsg.date, tmsg.out, tmsg.ttl, tmsg.media, tmsg.imp,
+                tmsg.mention)
+        if tmsg.uid in self._table_users:
+            text += 'From [users] -> {}\n\n'.format(
+                self._table_users[tmsg.uid].full_text_id)
+        else:
+            text += 'User uid missing in [users]\n\n'
+        text += '{}\n'.format(tmsg.blob)
+        if tmsg.blob_reply:
+            text += '\n----- IS REPLY  TO ---\n\n{}\n'.format(tmsg.blob_reply)
+        return text + '\n'
+
     def __save_table_messages(self, outdir):
-        with open(os.path.join(outdir, 'table_messages.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_messages.txt'),
+                self._compress, newline=None) as fo:
             for mid, tmsg in self._table_messages.items():
-                fo.write('-' * 80)
-                fo.write(
-                    '\nmid: {} uid: {} read_state: {} send_state: {} '
-                    'date: {} out: {} ttl: {} media: {} imp: {} '
-                    'mention: {}\n'.format(
-                        mid, tmsg.uid, tmsg.read_state, tmsg.send_state,
-                        tmsg.date, tmsg.out, tmsg.ttl, tmsg.media,
-                        tmsg.imp, tmsg.mention))
-                if tmsg.uid in self._table_users:
-                    fo.write(
-                        'From [users] -> {}\n\n'.format(
-                            self._table_users[tmsg.uid].full_text_id))
-                else:
-                    fo.write('User uid missing in [users]\n\n')
-                fo.write('{}\n'.format(tmsg.blob))
-                if tmsg.blob_reply:
-                    fo.write(
-                        '\n----- IS REPLY  TO ---\n\n{}\n'.format(
-                            tmsg.blob_reply))
-                fo.write('\n')
+                fo.write(self.__message_text(mid, tmsg))
+
+    def sent_file_from_entry(self, entry):
+        uid = entry['uid']
+        assert uid
+        blob = self._blob_parser.parse_blob(
+            entry['data'], 'sent_files_v2', to_text(uid))
+        # Some old telegram versions have not 'type' / 'parent'.
+        entry_type = getattr(entry, 'type', None)
+        entry_parent = getattr(entry, 'parent', None)
+        return tsentfile(uid, entry_type, entry_parent, blob)
 
     def __parse_table_sent_files_v2(self):
-        self._sqlite_db_cursor.execute('SELECT * from sent_files_v2')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('sent_files_v2')
 
         for entry in entries:
-            uid = entry['uid']
-            assert uid
-            assert uid not in self._table_sent_files
-            logger.info('parsing sent_files_v2, entry uid: %s', uid)
-            blob = self._blob_parser.parse_blob(entry['data'])
-            # Some old telegram versions have not 'type' / 'parent'.
-            entry_type = getattr(entry, 'type', None)
-            entry_parent = getattr(entry, 'parent', None)
-            sentfile = tsentfile(uid, entry_type, entry_parent, blob)
-            self._table_sent_files[uid] = sentfile
+            sentfile = self.sent_file_from_entry(entry)
+            assert sentfile.uid not in self._table_sent_files
+            self._table_sent_files[sentfile.uid] = sentfile
 
     def __save_table_sent_files_v2(self, outdir):
-        with open(os.path.join(outdir, 'table_sent_files_v2.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_sent_files_v2.txt'),
+                self._compress, newline=None) as fo:
             for uid, sentfile in self._table_sent_files.items():
                 assert uid == sentfile.uid
                 fo.write('-' * 80)
@@ -324,18 +472,20 @@ class tdb():
                         sentfile.uid, sentfile.ttype, sentfile.parent))
                 fo.write('{}\n\n'.format(sentfile.blob))
 
+    def user_from_entry(self, entry):
+        uid = int(entry['uid'])
+        assert uid
+        blob = self._blob_parser.parse_blob(entry['data'], 'users', uid)
+        return tuser(uid, entry['name'], entry['status'], blob)
+
     def __parse_table_users(self):
-        self._sqlite_db_cursor.execute('SELECT * from users')
-        entries = self._sqlite_db_cursor.fetchall()
+        entries = self.__select('users')
 
         user_self_set = False
         for entry in entries:
-            uid = int(entry['uid'])
-            assert uid
+            user = self.user_from_entry(entry)
+            uid = user.uid
             assert uid not in self._table_users
-            logger.info('parsing users, entry uid: %s', uid)
-            blob = self._blob_parser.parse_blob(entry['data'])
-            user = tuser(uid, entry['name'], entry['status'], blob)
 
             if user.is_self:
                 assert not user_self_set
@@ -345,8 +495,9 @@ class tdb():
         assert user_self_set
 
     def __save_table_users(self, outdir):
-        with open(os.path.join(outdir, 'table_users.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_users.txt'),
+                self._compress, newline=None) as fo:
             for uid, user in self._table_users.items():
                 assert uid == user.uid
                 fo.write('-' * 80)
@@ -362,26 +513,29 @@ class tdb():
                 fo.write('{}\n\n'.format(user.full_text_id))
                 fo.write('{}\n\n'.format(user.blob))
 
+    def user_settings_from_entry(self, entry):
+        uid = int(entry['uid'])
+        assert uid
+        blob = self._blob_parser.parse_blob(
+            entry['info'], 'user_settings', uid)
+        return tuser_settings(uid, blob, entry['pinned'])
+
     def __parse_table_user_settings(self):
         try:
-            self._sqlite_db_cursor.execute('SELECT * from user_settings')
-            entries = self._sqlite_db_cursor.fetchall()
+            entries = self.__select('user_settings')
         except Exception as ee:
             logger.error('Exception accessing user_settings table. %s', str(ee))
             return
 
         for entry in entries:
-            uid = int(entry['uid'])
-            assert uid
-            assert uid not in self._table_user_settings
-            logger.info('parsing user_settings, entry uid: %s', uid)
-            blob = self._blob_parser.parse_blob(entry['info'])
-            tus = tuser_settings(uid, blob, entry['pinned'])
-            self._table_user_settings[uid] = tus
+            tus = self.user_settings_from_entry(entry)
+            assert tus.uid not in self._table_user_settings
+            self._table_user_settings[tus.uid] = tus
 
     def __save_table_user_settings(self, outdir):
-        with open(os.path.join(outdir, 'table_user_settings.txt'),
-                  mode='w', encoding='utf-8') as fo:
+        with toutput.open_output(
+                os.path.join(outdir, 'table_user_settings.txt'),
+                self._compress, newline=None) as fo:
             for uid, tus in self._table_user_settings.items():
                 fo.write('-' * 80)
                 fo.write('\nuid: {} pinned: {}'.format(uid, tus.pinned))
@@ -395,26 +549,120 @@ class tdb():
 
     def parse(self):
         # TODO check new 6.3.0 tables
-        self.__parse_table_chats()
-        self.__parse_table_contacts()
-        self.__parse_table_dialogs()
-        self.__parse_table_enc_chats()
-        self.__parse_table_media_v2()
-        self.__parse_table_messages()
-        self.__parse_table_sent_files_v2()
-        self.__parse_table_users()
-        self.__parse_table_user_settings()
-
-    def save_parsed_tables(self):
-        self.__save_table_chats(self._outdirectory)
-        self.__save_table_contacts(self._outdirectory)
-        self.__save_table_dialogs(self._outdirectory)
-        self.__save_table_enc_chats(self._outdirectory)
-        self.__save_table_media_v2(self._outdirectory)
-        self.__save_table_messages(self._outdirectory)
-        self.__save_table_sent_files_v2(self._outdirectory)
-        self.__save_table_users(self._outdirectory)
-        self.__save_table_user_settings(self._outdirectory)
+        tables = (
+            ('chats', self.__parse_table_chats),
+            ('contacts', self.__parse_table_contacts),
+            ('dialogs', self.__parse_table_dialogs),
+            ('enc_chats', self.__parse_table_enc_chats),
+            ('media_v2', self.__parse_table_media_v2),
+            ('messages', self.__parse_table_messages),
+            ('sent_files_v2', self.__parse_table_sent_files_v2),
+            ('users', self.__parse_table_users),
+            ('user_settings', self.__parse_table_user_settings))
+        for name, parse_table in tables:
+            with self._metrics.phase('parse_table_' + name) as phase:
+                try:
+                    parse_table()
+                except Exception:
+                    logger.error('parsing table %s failed at row %d',
+                                 name, phase.rows)
+                    raise
+            self._parsed_tables.add(name)
+
+    def iter_table(self, name):
+        # The records of a table (tdb objects, dicts for contacts) yielded as
+        # they are decoded, none is kept. A cursor of its own, so the
+        # iterators can be interleaved.
+        from_entry = {
+            'chats': self.chat_from_entry,
+            'contacts': self.contact_from_entry,
+            'dialogs': self.dialog_from_entry,
+            'enc_chats': self.enc_chat_from_entry,
+            'media_v2': self.media_from_entry,
+            'messages': self.message_from_entry,
+            'sent_files_v2': self.sent_file_from_entry,
+            'users': self.user_from_entry,
+            'user_settings': self.user_settings_from_entry}[name]
+        try:
+            entries = self.__select(
+                name, self._sqlite_db_cursor.connection.cursor())
+        except Exception as ee:
+            if name != 'user_settings':
+                raise
+            # Not in every Telegram version, as in parse().
+            logger.error('Exception accessing user_settings table. %s',
+                         str(ee))
+            return
+        for entry in entries:
+            yield from_entry(entry)
+
+    def iter_messages(self):
+        return self.iter_table('messages')
+
+    def iter_timeline(self):
+        # The timeline rows (trow) in the create_timeline order. Chats,
+        # dialogs, secret chats and users are parsed first, they resolve the
+        # names; the messages are streamed. The tables already parsed (e.g.
+        # by parse()) are used as they are.
+        tables = (
+            ('chats', self.__parse_table_chats),
+            ('dialogs', self.__parse_table_dialogs),
+            ('enc_chats', self.__parse_table_enc_chats),
+            ('users', self.__parse_table_users))
+        for name, parse_table in tables:
+            if name not in self._parsed_tables:
+                parse_table()
+                self._parsed_tables.add(name)
+        yield from self.__chats_to_timeline()
+        yield from self.__dialogs_to_timeline()
+        yield from self.__enc_chats_to_timeline()
+        yield from self.__users_to_timeline()
+        for message in self.iter_messages():
+            yield self.message_to_row(message.mid, message)
+
+    def __save_tables_jsonl(self, outdir):
+        tables = (
+            ('chats', self._table_chats.values()),
+            ('contacts', [{'uid': uid, 'mutual': mutual} for uid, mutual
+                          in self._table_contacts.items()]),
+            ('dialogs', self._table_dialogs.values()),
+            ('enc_chats', self._table_enc_chats.values()),
+            ('media_v2', self._table_media.values()),
+            ('messages', self._table_messages.values()),
+            ('sent_files_v2', self._table_sent_files.values()),
+            ('users', self._table_users.values()),
+            ('user_settings', self._table_user_settings.values()))
+
+        for name, entries in tables:
+            with self._metrics.phase('save_table_' + name) as phase, \
+                    toutput.open_output(
+                        os.path.join(outdir, 'table_{}.jsonl'.format(name)),
+                        self._compress) as fo:
+                phase.rows += len(entries)
+                toutput.write_jsonl(
+                    fo, (entry if isinstance(entry, dict) else entry.to_dict()
+                         for entry in entries))
+
+    def save_parsed_tables(self, output_format=toutput.FORMAT_TEXT):
+        if output_format == toutput.FORMAT_JSONL:
+            self.__save_tables_jsonl(self._outdirectory)
+            return
+        tables = (
+            ('chats', self._table_chats, self.__save_table_chats),
+            ('contacts', self._table_contacts, self.__save_table_contacts),
+            ('dialogs', self._table_dialogs, self.__save_table_dialogs),
+            ('enc_chats', self._table_enc_chats, self.__save_table_enc_chats),
+            ('media_v2', self._table_media, self.__save_table_media_v2),
+            ('messages', self._table_messages, self.__save_table_messages),
+            ('sent_files_v2', self._table_sent_files,
+             self.__save_table_sent_files_v2),
+            ('users', self._table_users, self.__save_table_users),
+            ('user_settings', self._table_user_settings,
+             self.__save_table_user_settings))
+        for name, table, save_table in tables:
+            with self._metrics.phase('save_table_' + name) as phase:
+                phase.rows += len(table)
+                save_table(self._outdirectory)
 
     def __chats_to_timeline(self):
         for uid, chat in self._table_chats.items():
@@ -451,38 +699,36 @@ class tdb():
                 row.media = chat.photo_info
             yield row
 
-    def __dialogs_to_timeline(self):
-        for did, dialog in self._table_dialogs.items():
-            row = trow()
-            row.source = 'dialogs'
-            row.id = did
+    def dialog_to_row(self, did, dialog):
+        row = trow()
+        row.source = 'dialogs'
+        row.id = did
 
-            if did.bit_length() > 32:
-                cid = did >> 32
-            elif did < 0:
-                cid = (-1 * did)
-            else:
-                cid = did
-
-            # TODO refactor this! Missing negative conversion!!
-            if cid in self._table_chats:
-                row.dialog = self._table_chats[cid].shortest_id
-                row.dialog_type = self._table_chats[cid].chat_type
-            elif cid in self._table_enc_chats:
-                row.dialog = self._table_enc_chats[cid].shortest_id
-                row.dialog_type = 'encrypted 1-1'
-            else:
-                row.dialog_type = '1-1'
+        cid = dialog_to_chat_id(did)
 
-            row.content = 'dialog unread_count:{} inbox_max:{} outbox_max:{} ' \
-                'pts:{} last_mid:{}'.format(
-                    dialog.unread_count, dialog.inbox_max, dialog.outbox_max,
-                    dialog.pts, dialog.last_mid)
+        # TODO refactor this! Missing negative conversion!!
+        if cid in self._table_chats:
+            row.dialog = self._table_chats[cid].shortest_id
+            row.dialog_type = self._table_chats[cid].chat_type
+        elif cid in self._table_enc_chats:
+            row.dialog = self._table_enc_chats[cid].shortest_id
+            row.dialog_type = 'encrypted 1-1'
+        else:
+            row.dialog_type = '1-1'
 
-            row.timestamp = to_date(dialog.date)
-            row.type = TYPE_CHAT_LAST_UPDATE
+        row.content = 'dialog unread_count:{} inbox_max:{} outbox_max:{} ' \
+            'pts:{} last_mid:{}'.format(
+                dialog.unread_count, dialog.inbox_max, dialog.outbox_max,
+                dialog.pts, dialog.last_mid)
 
-            yield row
+        row.timestamp = to_date(dialog.date)
+        row.type = TYPE_CHAT_LAST_UPDATE
+
+        return row
+
+    def __dialogs_to_timeline(self):
+        for did, dialog in self._table_dialogs.items():
+            yield self.dialog_to_row(did, dialog)
 
     def __enc_chats_to_timeline(self):
         for uid, echat in self._table_enc_chats.items():
@@ -517,6 +763,8 @@ class tdb():
             yield row
 
             if echat.key_date:
+                # A new row: the yielded one can be kept by the caller.
+                row = copy.copy(row)
                 row.timestamp = to_date(echat.key_date)
                 row.type = TYPE_KEY_DATE
                 yield row
@@ -584,285 +832,333 @@ class tdb():
 
         return media_field
 
-    def __messages_to_timeline(self):
+    def message_to_row(self, mid, msg):
         # pylint: disable=R0912,R0915
-        for mid, msg in self._table_messages.items():
-            row = trow()
-            row.source = 'messages'
-            row.id = mid
-
-            if msg.blob.from_id:
-                row.from_id = msg.blob.from_id
-                if msg.blob.from_id in self._table_users:
-                    user = self._table_users[msg.blob.from_id]
-                    row.from_who = user.shortest_id
-                else:
-                    row.from_who = msg.blob.from_id
-
-            dialog, msg_seq = msg.dialog_and_sequence
-            row.extra.update({'dialog': dialog, 'sequence': msg_seq})
-
-            if dialog in self._table_chats:
-                row.dialog = self._table_chats[dialog].shortest_id
-                row.dialog_type = self._table_chats[dialog].chat_type
-            elif dialog in self._table_enc_chats:
-                row.dialog = self._table_enc_chats[dialog].shortest_id
-                row.dialog_type = 'encrypted 1-1'
-            else:
-                row.dialog_type = '1-1'
-
-            to_who, to_type = msg.to_id_and_type
-            assert to_who
-            row.to_id = to_who
-            if TYPE_MSG_TO_USER == to_type:
-                if to_who in self._table_users:
-                    user = self._table_users[to_who]
-                    row.to_who = user.shortest_id
-            elif TYPE_MSG_TO_CHANNEL == to_type:
-                assert dialog == to_who
-                if to_who in self._table_chats:
-                    chat = self._table_chats[to_who]
-                    row.to_who = chat.shortest_id
+        row = trow()
+        row.source = 'messages'
+        row.id = mid
+
+        if msg.blob.from_id:
+            row.from_id = msg.blob.from_id
+            if msg.blob.from_id in self._table_users:
+                user = self._table_users[msg.blob.from_id]
+                row.from_who = user.shortest_id
             else:
-                logger.error('message %s, unmanaged to_id!', msg.mid)
-                row.to_who = to_who
-
-            row.type = msg.blob.sname
-            action, action_dict = msg.action_string_and_dict
-            if action:
-                assert not msg.message_content
-                row.extra.update(action_dict)
-                row.content = action
-            else:
-                row.content = msg.message_content.strip('"\'')
-
-            if msg.blob_reply:
-                replied_msg = msg
-                replied_msg.blob = msg.blob_reply
-                replied_msg.blob_reply = None
-                row.content += ' [IS REPLY TO MSG ID {} {}]\n{}'.format(
-                    replied_msg.blob.id,
-                    to_date(replied_msg.message_date_from_blob),
-                    replied_msg.message_content.strip('"\''))
-
-            fwd_from = getattr(msg.blob, 'fwd_from', None)
-            if fwd_from:
-                fwd_from = fwd_from.fwd_from
-                row.content += ' [FORWARDED OF MSG BY {} {}]'.format(
-                    fwd_from.from_id, to_date(fwd_from.date.epoch))
-
-            views = getattr(msg.blob, 'views', None)
-            if views:
-                row.extra.update({'views': views})
-
-            media = self.__message_media(mid, msg)
-            if media:
-                row.media = escape_csv_string(media)
-
-            row.timestamp = to_date(msg.message_date_from_blob)
-            yield row
-
-    def __users_to_timeline(self):
-        for uid, user in self._table_users.items():
-            row = trow()
-            row.source = 'users'
-            row.id = uid
-            row.from_who = user.shortest_id
-            row.from_id = uid
-
-            if user.status > 0:
-                row.type = TYPE_USER_STATUS_UPDATE
-                row.timestamp = to_date(user.status)
-
-            row.content = '{}'.format(trow.dict_to_string(user.dict_id))
-            ui_dict = {}
-            flags = getattr(user.blob, 'flags', None)
-            if flags:
-                if flags.has_status:
-                    ui_dict['status'] = user.blob.status.status.sname
-                if user.blob.flags.is_bot:
-                    ui_dict['bot'] = 'true'
-                if user.blob.flags.is_mutual_contact:
-                    ui_dict['mutual_contact'] = 'true'
-                elif user.blob.flags.is_contact:
-                    ui_dict['contact'] = 'true'
-            if ui_dict:
-                row.content += ' {}'.format(trow.dict_to_string(ui_dict))
-
-            if user.photo_info:
-                row.media = user.photo_info
-            yield row
+                row.from_who = msg.blob.from_id
 
-    def create_timeline(self):
-        with open(os.path.join(self._outdirectory, 'timeline.csv'),
-                  mode='w', encoding='utf-8') as fo:
-            fo.write('{}\n'.format(self._separator.join(trow.fieldsnames())))
+        dialog, msg_seq = msg.dialog_and_sequence
+        row.extra.update({'dialog': dialog, 'sequence': msg_seq})
 
-            for row in self.__chats_to_timeline():
-                fo.write('{}\n'.format(row.to_row_string(self._separator)))
+        if dialog in self._table_chats:
+            row.dialog = self._table_chats[dialog].shortest_id
+            row.dialog_type = self._table_chats[dialog].chat_type
+        elif dialog in self._table_enc_chats:
+            row.dialog = self._table_enc_chats[dialog].shortest_id
+            row.dialog_type = 'encrypted 1-1'
+        else:
+            row.dialog_type = '1-1'
+
+        to_who, to_type = msg.to_id_and_type
+        assert to_who
+        row.to_id = to_who
+        if TYPE_MSG_TO_USER == to_type:
+            if to_who in self._table_users:
+                user = self._table_users[to_who]
+                row.to_who = user.shortest_id
+        elif TYPE_MSG_TO_CHANNEL == to_type:
+            assert dialog == to_who
+            if to_who in self._table_chats:
+                chat = self._table_chats[to_who]
+                row.to_who = chat.shortest_id
+        else:
+            logger.error('message %s, unmanaged to_id!', msg.mid)
+            row.to_who = to_who
 
-            for row in self.__dialogs_to_timeline():
-                fo.write('{}\n'.format(row.to_row_string(self._separator)))
+        row.type = msg.blob.sname
+        action, action_dict = msg.action_string_and_dict
+        if action:
+            assert not msg.message_content
+            row.extra.update(action_dict)
+            row.content = action
+        else:
+            row.content = msg.message_content
+
+        if msg.blob_reply:
+            replied_msg = copy.copy(msg)
+            replied_msg.blob = msg.blob_reply
+            replied_msg.blob_reply = None
+            row.content += ' [IS REPLY TO MSG ID {} {}]\n{}'.format(
+                replied_msg.blob.id,
+                to_date(replied_msg.message_date_from_blob),
+                replied_msg.message_content)
+
+        fwd_from = getattr(msg.blob, 'fwd_from', None)
+        if fwd_from:
+            fwd_from = fwd_from.fwd_from
+            row.content += ' [FORWARDED OF MSG BY {} {}]'.format(
+                fwd_from.from_id, to_date(fwd_from.date.epoch))
+
+        views = getattr(msg.blob, 'views', None)
+        if views:
+            row.extra.update({'views': views})
+
+        media = self.__message_media(mid, msg)
+        if media:
+            row.media = media
+
+        row.timestamp = to_date(msg.message_date_from_blob)
+        return row
 
-            for row in self.__enc_chats_to_timeline():
-                fo.write('{}\n'.format(row.to_row_string(self._separator)))
+    def __messages_to_timeline(self):
+        for mid, msg in self._table_messages.items():
+            yield self.message_to_row(mid, msg)
+
+    def user_to_row(self, uid, user):
+        row = trow()
+        row.source = 'users'
+        row.id = uid
+        row.from_who = user.shortest_id
+        row.from_id = uid
+
+        if user.status > 0:
+            row.type = TYPE_USER_STATUS_UPDATE
+            row.timestamp = to_date(user.status)
+
+        row.content = '{}'.format(trow.dict_to_string(user.dict_id))
+        ui_dict = {}
+        flags = getattr(user.blob, 'flags', None)
+        if flags:
+            if flags.has_status:
+                ui_dict['status'] = user.blob.status.status.sname
+            if user.blob.flags.is_bot:
+                ui_dict['bot'] = 'true'
+            if user.blob.flags.is_mutual_contact:
+                ui_dict['mutual_contact'] = 'true'
+            elif user.blob.flags.is_contact:
+                ui_dict['contact'] = 'true'
+        if ui_dict:
+            row.content += ' {}'.format(trow.dict_to_string(ui_dict))
+
+        if user.photo_info:
+            row.media = user.photo_info
+        return row
 
-            for row in self.__users_to_timeline():
-                fo.write('{}\n'.format(row.to_row_string(self._separator)))
+    def __users_to_timeline(self):
+        for uid, user in self._table_users.items():
+            yield self.user_to_row(uid, user)
+
+    @staticmethod
+    def __row_dialog_id(row):
+        dialog_id = row.extra.get('dialog', None)
+        if dialog_id is None:
+            if row.source in ('chats', 'enc_chats'):
+                dialog_id = row.id
+            elif row.source == 'dialogs':
+                dialog_id = dialog_to_chat_id(row.id)
+        return dialog_id
+
+    def __timeline_record(self, row):
+        dialog_id = self.__row_dialog_id(row)
+        return (row.timestamp, row.source, row.id, row.type,
+                row.from_who, row.from_id or None, row.to_who,
+                row.to_id or None, row.dialog, row.dialog_type,
+                row.content, row.media,
+                toutput.to_json_string(row.extra), dialog_id)
+
+    def __message_record(self, mid, msg):
+        dialog, sequence = msg.dialog_and_sequence
+        to_id, to_type = msg.to_id_and_type
+        content = msg.message_content
+        action = getattr(msg.blob, 'action', None)
+        if action:
+            content = action.action.sname
+        fwd_from = getattr(msg.blob, 'fwd_from', None)
+        fwd_from_id = None
+        if fwd_from:
+            fwd_from_id = getattr(fwd_from.fwd_from, 'from_id', None)
+        blob_reply = None
+        if msg.blob_reply:
+            blob_reply = toutput.to_json_string(msg.blob_reply)
+        return (mid, msg.uid, dialog, sequence,
+                msg.message_date_from_blob or msg.date,
+                getattr(msg.blob, 'from_id', None), to_id, to_type,
+                msg.out, msg.read_state, msg.send_state, msg.ttl, msg.media,
+                msg.imp, msg.mention, msg.blob.sname, content,
+                self.__message_media(mid, msg),
+                getattr(msg.blob, 'reply_to_msg_id', None), fwd_from_id,
+                getattr(msg.blob, 'views', None),
+                toutput.to_json_string(msg.blob), blob_reply)
+
+    def save_database(self):
+        # pylint: disable=R0201
+        with toutdb.toutdb(os.path.join(
+                self._outdirectory, toutdb.DATABASE_NAME)) as odb:
+            odb.insert_many('users', (
+                (uid, to_text(user.name), user.status, user.username,
+                 user.first_name, user.last_name, user.phone,
+                 int(bool(user.is_self)), toutput.to_json_string(user.blob))
+                for uid, user in self._table_users.items()))
+            odb.insert_many('chats', (
+                (uid, to_text(chat.name), chat.blob.title.string,
+                 chat.dict_id.get('username', None), chat.chat_type,
+                 chat.creation_date, toutput.to_json_string(chat.blob))
+                for uid, chat in self._table_chats.items()))
+            odb.insert_many('dialogs', (
+                (did, dialog.date, dialog.unread_count, dialog.last_mid,
+                 dialog.inbox_max, dialog.outbox_max, dialog.last_mid_i,
+                 dialog.unread_count_i, dialog.pts, dialog.date_i,
+                 dialog.pinned, dialog.flags)
+                for did, dialog in self._table_dialogs.items()))
+            odb.insert_many('media', (
+                (mid, media.uid, media.date, media.ttype,
+                 self.__message_media(mid, media),
+                 toutput.to_json_string(media.blob))
+                for mid, media in self._table_media.items()))
+            for mid, msg in self._table_messages.items():
+                odb.insert('messages', self.__message_record(mid, msg))
+                odb.insert_text(mid, msg.text_fields)
+            odb.insert_many('timeline', (
+                self.__timeline_record(row) for row in self.__timeline_rows()))
+
+    def __timeline_rows(self):
+        timed = self._metrics.timed
+        yield from timed('chats_to_timeline', self.__chats_to_timeline())
+        yield from timed('dialogs_to_timeline', self.__dialogs_to_timeline())
+        yield from timed(
+            'enc_chats_to_timeline', self.__enc_chats_to_timeline())
+        yield from timed('users_to_timeline', self.__users_to_timeline())
+        yield from timed(
+            'messages_to_timeline', self.__messages_to_timeline())
+
+    def create_timeline(self, csv_mode=toutput.CSV_MODE_LEGACY,
+                        output_format=toutput.FORMAT_TEXT):
+        if output_format == toutput.FORMAT_JSONL:
+            filename = 'timeline.jsonl'
+        else:
+            filename = 'timeline.csv'
+        with toutput.open_output(
+                os.path.join(self._outdirectory, filename),
+                self._compress) as fo:
+            if output_format == toutput.FORMAT_JSONL:
+                writer = toutput.ttimeline_jsonl(fo, trow.fieldsnames())
+            else:
+                writer = toutput.ttimeline_csv(
+                    fo, trow.fieldsnames(), csv_mode, self._separator)
+            writer.write_header()
+            writer.write_rows(self.__timeline_rows())
+
+    def __dialog_name(self, dialog):
+        for table in (self._table_chats, self._table_enc_chats,
+                      self._table_users):
+            if dialog in table:
+                return table[dialog].shortest_id
+        return ''
 
-            for row in self.__messages_to_timeline():
-                fo.write('{}\n'.format(row.to_row_string(self._separator)))
+    def create_shards(self, csv_mode=toutput.CSV_MODE_LEGACY,
+                      output_format=toutput.FORMAT_TEXT, workers=4,
+                      max_handles=64):
+        # Timeline rows and messages dumps split per dialog in the
+        # SHARDS_DIRECTORY, rows without a dialog (e.g. users) go to the
+        # SHARD_GLOBAL timeline. The index maps the dialogs to their files.
+        directory = os.path.join(self._outdirectory, SHARDS_DIRECTORY)
+        shards = toutput.tshard_writer(
+            directory, workers, max_handles, self._compress)
+        if output_format == toutput.FORMAT_JSONL:
+            formatter = toutput.ttimeline_jsonl(None, trow.fieldsnames())
+            timeline_name = 'timeline_{}.jsonl'
+            messages_name = 'messages_{}.jsonl'
+        else:
+            formatter = toutput.ttimeline_csv(
+                None, trow.fieldsnames(), csv_mode, self._separator)
+            timeline_name = 'timeline_{}.csv'
+            messages_name = 'messages_{}.txt'
+        header = formatter.header_line()
+
+        dialogs = {}
+        for row in self.__timeline_rows():
+            dialog = self.__row_dialog_id(row)
+            if dialog is None:
+                dialog = SHARD_GLOBAL
+            name = timeline_name.format(dialog)
+            dialogs.setdefault(dialog, [None, None])[0] = name
+            shards.write(name, header, formatter.format_row(row))
+
+        for mid, tmsg in self._table_messages.items():
+            dialog, _ = tmsg.dialog_and_sequence
+            name = messages_name.format(dialog)
+            dialogs.setdefault(dialog, [None, None])[1] = name
+            if output_format == toutput.FORMAT_JSONL:
+                text = toutput.to_json_line(tmsg.to_dict())
+            else:
+                text = self.__message_text(mid, tmsg)
+            shards.write(name, None, text)
+        shards.close()
+
+        counts = shards.counts
+        with toutput.open_output(
+                os.path.join(directory, SHARDS_INDEX), self._compress) as fo:
+            writer = csv.writer(fo, lineterminator='\n')
+            writer.writerow(('dialog', 'name', 'timeline', 'timeline_rows',
+                             'messages', 'messages_rows'))
+            for dialog, (timeline, messages) in dialogs.items():
+                writer.writerow((
+                    dialog, self.__dialog_name(dialog),
+                    shards.filename(timeline) if timeline else '',
+                    counts[timeline] if timeline else 0,
+                    shards.filename(messages) if messages else '',
+                    counts[messages] if messages else 0))
 
 #------------------------------------------------------------------------------
 
 class trow():
 
-    def __init__(self):
-        self._timestamp = ''
-        self._source = ''
-        self._id = ''
-        self._type = ''
-        self._from_who = ''
-        self._from_id = ''
-        self._to_who = ''
-        self._to_id = ''
-        self._dialog = ''
-        self._dialog_type = ''
-        self._content = ''
-        self._media = ''
-        self._extra = {}
+    __slots__ = ('timestamp', 'source', 'id', 'type',
+                 'from_who', 'from_id', 'to_who', 'to_id',
+                 'dialog', 'dialog_type',
+                 'content', 'media', 'extra')
 
+    def __init__(self):
+        self.timestamp = ''
+        self.source = ''
+        self.id = ''
+        self.type = ''
+        self.from_who = ''
+        self.from_id = ''
+        self.to_who = ''
+        self.to_id = ''
+        self.dialog = ''
+        self.dialog_type = ''
+        self.content = ''
+        self.media = ''
+        self.extra = {}
+
+    @staticmethod
     def fieldsnames():
-        # pylint: disable=E0211,R0201
         return ('timestamp', 'source', 'id', 'type',
                 'from', 'from_id', 'to', 'to_id',
                 'dialog', 'dialog_type',
                 'content', 'media', 'extra')
 
+    @staticmethod
     def dict_to_string(dict_in):
-        # pylint: disable=E0213,E1101
         return ' '.join("{}:{}".format(k, v) for (k, v) in dict_in.items())
 
-    def to_row_string(self, separator):
-        # pylint: disable=W1308
-        return '{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}'.format(
-            self._timestamp, separator,
-            self._source, separator,
-            self._id, separator,
-            self._type, separator,
-            self._from_who, separator,
-            self._from_id, separator,
-            self._to_who, separator,
-            self._to_id, separator,
-            self._dialog, separator,
-            self._dialog_type, separator,
-            escape_csv_string(self._content), separator,
-            self._media, separator,
-            escape_csv_string(trow.dict_to_string(self._extra)))
-
-    @property
-    def timestamp(self):
-        return self._timestamp
-
-    @timestamp.setter
-    def timestamp(self, value):
-        self._timestamp = value
-
-    @property
-    def source(self):
-        return self._source
-
-    @source.setter
-    def source(self, value):
-        self._source = value
-
-    @property
-    def id(self):
-        return self._id
-
-    @id.setter
-    def id(self, value):
-        self._id = value
-
-    @property
-    def type(self):
-        return self._type
-
-    @type.setter
-    def type(self, value):
-        self._type = value
-
-    @property
-    def from_who(self):
-        return self._from_who
-
-    @from_who.setter
-    def from_who(self, value):
-        self._from_who = value
-
-    @property
-    def from_id(self):
-        return self._from_id
-
-    @from_id.setter
-    def from_id(self, value):
-        self._from_id = value
-
-    @property
-    def to_who(self):
-        return self._to_who
-
-    @to_who.setter
-    def to_who(self, value):
-        self._to_who = value
-
-    @property
-    def to_id(self):
-        return self._to_id
-
-    @to_id.setter
-    def to_id(self, value):
-        self._to_id = value
-
-    @property
-    def dialog(self):
-        return self._dialog
-
-    @dialog.setter
-    def dialog(self, value):
-        self._dialog = value
-
-    @property
-    def dialog_type(self):
-        return self._dialog_type
-
-    @dialog_type.setter
-    def dialog_type(self, value):
-        self._dialog_type = value
-
-    @property
-    def content(self):
-        return self._content
-
-    @content.setter
-    def content(self, value):
-        self._content = value
-
-    @property
-    def media(self):
-        return self._media
-
-    @media.setter
-    def media(self, value):
-        self._media = value
-
-    @property
-    def extra(self):
-        return self._extra
-
-    @extra.setter
-    def extra(self, value):
-        pass
+    def to_tuple(self):
+        # Same order as fieldsnames(), the extra dictionary is flattened.
+        return (self.timestamp, self.source, self.id, self.type,
+                self.from_who, self.from_id, self.to_who, self.to_id,
+                self.dialog, self.dialog_type,
+                self.content, self.media, trow.dict_to_string(self.extra))
+
+    def to_dict(self):
+        # Same keys as fieldsnames(), the extra dictionary is kept as is.
+        return {'timestamp': self.timestamp, 'source': self.source,
+                'id': self.id, 'type': self.type,
+                'from': self.from_who, 'from_id': self.from_id,
+                'to': self.to_who, 'to_id': self.to_id,
+                'dialog': self.dialog, 'dialog_type': self.dialog_type,
+                'content': self.content, 'media': self.media,
+                'extra': self.extra}
 
 #------------------------------------------------------------------------------
 
@@ -873,6 +1169,9 @@ class tchat():
         self._name = name
         self._blob = blob
 
+    def to_dict(self):
+        return {'uid': self.uid, 'name': self.name, 'blob': self.blob}
+
     @property
     def blob(self):
         return self._blob
@@ -980,6 +1279,15 @@ class tdialog():
         self._pinned = int(pinned)
         self._flags = int(flags)
 
+    def to_dict(self):
+        return {'did': self.did, 'date': self.date,
+                'unread_count': self.unread_count, 'last_mid': self.last_mid,
+                'inbox_max': self.inbox_max, 'outbox_max': self.outbox_max,
+                'last_mid_i': self.last_mid_i,
+                'unread_count_i': self.unread_count_i, 'pts': self.pts,
+                'date_i': self.date_i, 'pinned': self.pinned,
+                'flags': self.flags}
+
     @property
     def did(self):
         return self._did
@@ -1055,6 +1363,17 @@ class techat():
         self._admin_id = int(admin_id)
         self._mtproto_seq = int(mtproto_seq)
 
+    def to_dict(self):
+        return {'uid': self.uid, 'user': self.user, 'name': self.name,
+                'g': self.g, 'authkey': self.authkey, 'ttl': self.ttl,
+                'layer': self.layer, 'seq_in': self.seq_in,
+                'seq_out': self.seq_out, 'use_count': self.use_count,
+                'exchange_id': self.exchange_id, 'key_date': self.key_date,
+                'fprint': self.fprint, 'fauthkey': self.fauthkey,
+                'khash': self.khash, 'in_seq_no': self.in_seq_no,
+                'admin_id': self.admin_id, 'mtproto_seq': self.mtproto_seq,
+                'blob': self.blob}
+
     @property
     def uid(self):
         return self._uid
@@ -1176,6 +1495,10 @@ class tmedia():
         self._ttype = int(ttype)
         self._blob = blob
 
+    def to_dict(self):
+        return {'mid': self.mid, 'uid': self.uid, 'date': self.date,
+                'type': self.ttype, 'blob': self.blob}
+
     @property
     def blob(self):
         return self._blob
@@ -1215,6 +1538,13 @@ class tmessage():
         self._imp = int(imp)
         self._mention = int(mention)
 
+    def to_dict(self):
+        return {'mid': self.mid, 'uid': self.uid,
+                'read_state': self.read_state, 'send_state': self.send_state,
+                'date': self.date, 'out': self.out, 'ttl': self.ttl,
+                'media': self.media, 'imp': self.imp, 'mention': self.mention,
+                'blob': self.blob, 'blob_reply': self.blob_reply}
+
     @property
     def blob(self):
         return self._blob
@@ -1284,9 +1614,48 @@ class tmessage():
     def message_content(self):
         msg = getattr(self.blob, 'message', None)
         if msg:
-            return escape_csv_string(msg.string)
+            return msg.string
         return ''
 
+    @property
+    def text_fields(self):
+        # Searchable strings of the message as (field, string) pairs: text,
+        # entities urls, media caption, webpage url/title/description and
+        # file names.
+        fields = []
+        msg = getattr(self.blob, 'message', None)
+        if msg and msg.string:
+            fields.append(('text', msg.string))
+        entities = getattr(self.blob, 'entities', None)
+        if entities:
+            for entry in entities.message_entity_array:
+                url = getattr(entry.message_entity, 'url', None)
+                if url and url.string:
+                    fields.append(('url', url.string))
+        media = getattr(self.blob, 'media', None)
+        if not media:
+            return fields
+        media = media.media
+        caption = getattr(media, 'caption_legacy', None)
+        if caption and caption.string:
+            fields.append(('caption', caption.string))
+        webpage = getattr(media, 'webpage', None)
+        if webpage:
+            webpage = webpage.webpage
+            for name in ('url', 'title', 'description'):
+                value = getattr(webpage, name, None)
+                if value and value.string:
+                    fields.append(('webpage_' + name, value.string))
+        document = getattr(media, 'document', None)
+        if document:
+            attributes = getattr(
+                document.document, 'document_attributes_array', None)
+            for entry in attributes or ():
+                if entry.document.sname == 'document_attribute_filename':
+                    fields.append(
+                        ('file_name', entry.document.file_name.string))
+        return fields
+
     @property
     def message_date_from_blob(self):
         date = getattr(self.blob, 'date', None)
@@ -1322,10 +1691,10 @@ class tmessage():
     def action_string_and_dict(self):
         action = getattr(self.blob, 'action', None)
         if action:
-            action_copy = action.action
-            del action_copy['_io']
-            del action_copy['signature']
-            return action_copy.sname, action_copy
+            action = action.action
+            action_dict = {key: value for key, value in action.items()
+                           if key not in ('_io', 'signature')}
+            return action.sname, action_dict
         return None, None
 
 #------------------------------------------------------------------------------
@@ -1338,6 +1707,10 @@ class tsentfile():
         self._parent = parent
         self._blob = blob
 
+    def to_dict(self):
+        return {'uid': self.uid, 'type': self.ttype, 'parent': self.parent,
+                'blob': self.blob}
+
     @property
     def blob(self):
         return self._blob
@@ -1363,6 +1736,9 @@ class tuser_settings():
         self._blob = blob
         self._pinned = int(pinned)
 
+    def to_dict(self):
+        return {'uid': self.uid, 'pinned': self.pinned, 'blob': self.blob}
+
     @property
     def uid(self):
         return self._uid
@@ -1387,6 +1763,10 @@ class tuser():
         # Defensive check
         assert int(uid) == int(blob.id)
 
+    def to_dict(self):
+        return {'uid': self.uid, 'name': self.name, 'status': self.status,
+                'blob': self.blob}
+
     @property
     def uid(self):
         return self._uid
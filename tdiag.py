@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, blobs diagnostics.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Blobs parsing issues aggregated by table, signature and kind.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+#------------------------------------------------------------------------------
+
+KIND_UNPARSED = 'unparsed'
+KIND_NOT_ALL_PARSED = 'not_all_parsed'
+KIND_NOT_SUPPORTED = 'not_supported'
+KIND_UNKNOWN_SIGNATURE = 'unknown_signature'
+# A known signature, not of the detected Telegram version(s).
+KIND_OUT_OF_VERSION = 'out_of_version'
+
+# Keys (e.g. the message mid) kept for each (table, signature, kind).
+SAMPLES = 5
+
+#------------------------------------------------------------------------------
+
+class tdiagnostic():
+
+    __slots__ = ('table', 'signature', 'kind', 'name', 'count', 'bytes',
+                 'samples')
+
+    def __init__(self, table, signature, kind, name):
+        self.table = table
+        self.signature = signature
+        self.kind = kind
+        self.name = name
+        self.count = 0
+        self.bytes = 0
+        self.samples = []
+
+#------------------------------------------------------------------------------
+
+class tdiagnostics():
+
+    def __init__(self, samples=SAMPLES):
+        self._entries = {}
+        self._samples = samples
+
+    @property
+    def entries(self):
+        return list(self._entries.values())
+
+    def __len__(self):
+        return sum(entry.count for entry in self._entries.values())
+
+    def add(self, table, signature, kind, name, key=None, size=0):
+        # pylint: disable=R0913
+        entry = self._entries.get((table, signature, kind))
+        if not entry:
+            entry = tdiagnostic(table, signature, kind, name)
+            self._entries[(table, signature, kind)] = entry
+        entry.count += 1
+        entry.bytes += size
+        if key is not None and len(entry.samples) < self._samples:
+            entry.samples.append(key)
+
+    def summary(self):
+        lines = ['{:<14} {:<10} {:<18} {:<36} {:>8} {:>8}  {}'.format(
+            'table', 'signature', 'kind', 'name', 'count', 'bytes',
+            'sample keys')]
+        for entry in sorted(self._entries.values(),
+                            key=lambda entry: entry.count, reverse=True):
+            lines.append(
+                '{:<14} 0x{:08x} {:<18} {:<36} {:>8} {:>8}  {}'.format(
+                    entry.table or '-', entry.signature, entry.kind,
+                    entry.name, entry.count, entry.bytes,
+                    ' '.join(str(key) for key in entry.samples)))
+        return '\n'.join(lines)
@@ -43,35 +43,179 @@
 # pylint: disable= C0103,C0116
 
 import argparse
+import csv
+import io
 import os
 import sqlite3
 import sys
 
 import logger
-import tblob
+import tcensus
 import tdb
+import tdss
+import thunt
+import tmetrics
+import toutput
+import tprofile
+import tprogress
+import tversion
 
 VERSION = '20200807'
 
+BLOB_PROFILE_FILENAME = 'blob_profile.csv'
+BLOB_PROFILE_TOP = 20
+
 #------------------------------------------------------------------------------
 
-def process(infilename, outdirectory):
+# tblob (and construct) are imported only when the blobs are parsed: --help,
+# the census and the version detection do not pay for them.
+# pylint: disable=C0415
+
+def save_blob_profile(profiler, filename):
+    import tblob
+    with io.open(filename, mode='w', encoding='utf-8', newline='') as fo:
+        writer = csv.DictWriter(fo, tblob.tprofiler.FIELDS,
+                                lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(counter.to_dict()
+                         for counter in profiler.sorted_counters())
+
+def process(infilename, outdirectory, csv_mode=toutput.CSV_MODE_LEGACY,
+            output_format=toutput.FORMAT_TEXT, hunt_patterns=None,
+            compress=None, shard_workers=0, metrics=False,
+            blob_profile=False, profile=None, progress=False,
+            restrict_version=False):
 
     db_connection = None
     db_uri = 'file:' + infilename + '?mode=ro'
 
-    tparse = tblob.tblob()
+    profiler = tprofile.tprofile(profile, outdirectory)
+
+    if compress and output_format == toutput.FORMAT_SQLITE:
+        logger.warning('The output database cannot be compressed, ignoring '
+                       'compression for it')
+    if shard_workers and output_format == toutput.FORMAT_SQLITE:
+        logger.warning('The output database cannot be sharded, ignoring '
+                       'sharding')
+        shard_workers = 0
+
+    hunter = None
+    if hunt_patterns:
+        hunter = thunt.thunter(
+            hunt_patterns, os.path.join(outdirectory, thunt.HITS_FILENAME),
+            compress)
 
     with sqlite3.connect(db_uri, uri=True) as db_connection:
         db_connection.text_factory = bytes
         db_connection.row_factory = sqlite3.Row
         db_cursor = db_connection.cursor()
 
-        teledb = tdb.tdb(outdirectory, tparse, db_cursor)
-        teledb.parse()
+        signatures = None
+        if restrict_version:
+            detector = tversion.tversion(db_cursor)
+            detector.detect()
+            logger.warning('blobs checked against version(s): %s',
+                           ', '.join(detector.best_versions))
+            signatures = detector.signatures()
+        import tblob
+        tparse = tblob.tblob(blob_profile, signatures)
+
+        teledb = tdb.tdb(outdirectory, tparse, db_cursor, hunter, compress,
+                         tmetrics.tmetrics() if metrics else None,
+                         tprogress.tprogress() if progress else None)
+        with profiler.phase('parse'):
+            teledb.parse()
+    phases = teledb.metrics
+
+    if hunter:
+        hunter.close()
+        logger.warning('hunting: %d hits in %s', hunter.hits,
+                       thunt.HITS_FILENAME)
+
+    if output_format == toutput.FORMAT_SQLITE:
+        # Tables and timeline go in the same database, a single phase.
+        with phases.phase('save_database'), profiler.phase('save'):
+            teledb.save_database()
+    else:
+        with profiler.phase('save'):
+            teledb.save_parsed_tables(output_format)
+        if shard_workers:
+            with phases.phase('create_shards'), profiler.phase('timeline'):
+                teledb.create_shards(csv_mode, output_format, shard_workers)
+        else:
+            with phases.phase('create_timeline'), profiler.phase('timeline'):
+                teledb.create_timeline(csv_mode, output_format)
+
+    diagnostics = tparse.diagnostics
+    if diagnostics:
+        print('{} blobs parsing issues (details with -vvv):'.format(
+            len(diagnostics)), file=sys.stderr)
+        print(diagnostics.summary(), file=sys.stderr)
+
+    if blob_profile:
+        save_blob_profile(tparse.profiler, os.path.join(
+            outdirectory, BLOB_PROFILE_FILENAME))
+        print(tparse.profiler.report(BLOB_PROFILE_TOP), file=sys.stderr)
+
+    if metrics:
+        phases.save(os.path.join(outdirectory, tmetrics.METRICS_FILENAME))
+        print(phases.summary(), file=sys.stderr)
+
+def open(infilename, cache_size=tdb.LOOKUP_CACHE_SIZE):
+    # pylint: disable=W0622
+    # Random access, e.g. teleparser.open('cache4.db').message(mid).
+    import tlookup
+    return tlookup.tlookup(infilename, cache_size)
+
+def iter_db(infilename, iterator, *args):
+    # Streams a tdb iterator over the cache4.db, nothing is saved.
+    # The connection is closed even when the consumer stops early (the
+    # generator is closed).
+    db_uri = 'file:' + infilename + '?mode=ro'
+    db_connection = sqlite3.connect(db_uri, uri=True)
+    try:
+        db_connection.text_factory = bytes
+        db_connection.row_factory = sqlite3.Row
+        import tblob
+        teledb = tdb.tdb(None, tblob.tblob(), db_connection.cursor())
+        yield from getattr(teledb, iterator)(*args)
+    finally:
+        db_connection.close()
+
+def iter_messages(infilename):
+    # tdb.tmessage objects, as they are decoded.
+    return iter_db(infilename, 'iter_messages')
+
+def iter_table(infilename, name):
+    # The records of a table, e.g. tdb.tuser objects for 'users'.
+    return iter_db(infilename, 'iter_table', name)
+
+def iter_timeline(infilename):
+    # tdb.trow timeline rows (row.to_dict()), the messages streamed.
+    return iter_db(infilename, 'iter_timeline')
+
+def census(infilename, outdirectory):
+
+    db_uri = 'file:' + infilename + '?mode=ro'
+
+    with sqlite3.connect(db_uri, uri=True) as db_connection:
+        db_connection.text_factory = bytes
+        tcen = tcensus.tcensus(db_connection.cursor(), tdss.tdss_callbacks)
+        tcen.run()
+
+    tcen.save(os.path.join(outdirectory, tcensus.CENSUS_FILENAME))
+    print(tcen.summary(), file=sys.stderr)
+
+def detect_version(infilename):
+
+    db_uri = 'file:' + infilename + '?mode=ro'
+
+    with sqlite3.connect(db_uri, uri=True) as db_connection:
+        db_connection.text_factory = bytes
+        detector = tversion.tversion(db_connection.cursor())
+        detector.detect()
 
-    teledb.save_parsed_tables()
-    teledb.create_timeline()
+    print(detector.report(), file=sys.stderr)
 
 #------------------------------------------------------------------------------
 
@@ -86,13 +230,70 @@ if __name__ == '__main__':
     parser.add_argument('outdirectory', help='output directory, must exist')
     parser.add_argument('-v', '--verbose', action='count',
                         help='verbose level, -v to -vvv')
+    parser.add_argument('-f', '--format', choices=toutput.FORMATS,
+                        default=toutput.FORMAT_TEXT,
+                        help='output format, text (default: txt tables and '
+                        'csv timeline), jsonl (one JSON object per line) or '
+                        'sqlite (single teleparser.db database)')
+    parser.add_argument('--hunt', metavar='PATTERNS',
+                        help='file of keywords to hunt in messages text, '
+                        'captions, urls and file names, one per line '
+                        '(\'re:\' prefix for regular expressions)')
+    parser.add_argument('-z', '--compress', choices=toutput.COMPRESSIONS,
+                        help='compress the output files while writing them '
+                        '(.gz or .xz added to the names)')
+    parser.add_argument('--shard', action='store_true',
+                        help='split timeline and messages per dialog in the '
+                        'dialogs subdirectory')
+    parser.add_argument('--shard-workers', type=int, default=4,
+                        help='threads writing the shards (default 4)')
+    parser.add_argument('--metrics', action='store_true',
+                        help='time each phase, summary on stderr and '
+                        'details in metrics.json')
+    parser.add_argument('--blob-profile', action='store_true',
+                        help='decode time per blob signature, nested ones '
+                        'included, top ones on stderr and all of them in '
+                        'blob_profile.csv')
+    parser.add_argument('--profile', choices=tprofile.PROFILES,
+                        help='profile the parse, save and timeline phases '
+                        'with cProfile (profile_<phase>.pstats) or '
+                        'tracemalloc (profile_<phase>_mem.txt)')
+    parser.add_argument('--progress', action='store_true',
+                        help='rows/s and ETA of each table being parsed on '
+                        'stderr (default when stderr is a terminal)')
+    parser.add_argument('--no-progress', action='store_true',
+                        help='no progress reporting')
+    parser.add_argument('--census', action='store_true',
+                        help='only count the blobs signatures per table '
+                        '(supported, not supported, unknown) in census.csv, '
+                        'no blob is parsed')
+    parser.add_argument('--detect-version', action='store_true',
+                        help='only detect the Telegram version by sampling '
+                        'the blobs signatures, no blob is parsed')
+    parser.add_argument('--restrict-version', action='store_true',
+                        help='report the top-level blobs not of the detected '
+                        'Telegram version(s) as out of version (they are '
+                        'parsed all the same)')
+    parser.add_argument('--csv', choices=toutput.CSV_MODES,
+                        default=toutput.CSV_MODE_LEGACY,
+                        help='timeline csv escaping, legacy (default) or '
+                        'strict rfc4180')
     args = parser.parse_args()
 
     logger.configure_logging(args.verbose)
 
     if os.path.exists(args.infilename):
-        if os.path.isdir(args.outdirectory):
-            process(args.infilename, args.outdirectory)
+        if args.detect_version:
+            detect_version(args.infilename)
+        elif os.path.isdir(args.outdirectory) and args.census:
+            census(args.infilename, args.outdirectory)
+        elif os.path.isdir(args.outdirectory):
+            process(args.infilename, args.outdirectory, args.csv,
+                    args.format, args.hunt, args.compress,
+                    args.shard_workers if args.shard else 0, args.metrics,
+                    args.blob_profile, args.profile,
+                    (args.progress or sys.stderr.isatty())
+                    and not args.no_progress, args.restrict_version)
         else:
             logger.error('Output directory [%s] does not exist!',
                          args.outdirectory)
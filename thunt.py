@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, keywords hunting.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Multi-pattern keywords hunting over messages.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import csv
+import re
+
+import logger
+import toutput
+
+#------------------------------------------------------------------------------
+
+HITS_FILENAME = 'hunt_hits.csv'
+HITS_FIELDS = ('mid', 'dialog', 'field', 'pattern', 'start', 'end', 'match')
+
+# Lines in the patterns file starting with this prefix are regular
+# expressions, all the others are literal terms (case insensitive).
+REGEX_PREFIX = 're:'
+
+#------------------------------------------------------------------------------
+
+def load_patterns(filename):
+    patterns = []
+    with open(filename, mode='r', encoding='utf-8') as fi:
+        for line in fi:
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            patterns.append(line)
+    return patterns
+
+def compile_pattern(pattern):
+    # A regular expression that can be an alternative of the prefilter: no
+    # capturing groups (their numbers, backreferences and names change once
+    # combined) and no global inline flags (they would apply to all the
+    # alternatives).
+    if not pattern.startswith(REGEX_PREFIX):
+        return re.compile(re.escape(pattern), re.IGNORECASE)
+    expression = pattern[len(REGEX_PREFIX):]
+    regex = re.compile(expression, re.IGNORECASE)
+    if regex.groups:
+        raise ValueError('pattern {!r}: capturing groups are not allowed, use '
+                         '(?:...)'.format(pattern))
+    if re.compile(expression).flags != re.compile('').flags:
+        raise ValueError('pattern {!r}: global inline flags are not allowed, '
+                         'use (?flags:...)'.format(pattern))
+    return regex
+
+def compile_patterns(patterns):
+    # The patterns combined as alternatives of a single expression are only a
+    # prefilter: the text is scanned once, and most texts have no hits. The
+    # texts it matches are scanned with each pattern, a single scan reports
+    # only non overlapping matches and would miss a pattern found inside (or
+    # across) the match of another one.
+    regexes = [(pattern, compile_pattern(pattern)) for pattern in patterns]
+    prefilter = re.compile('|'.join(
+        '(?:{})'.format(regex.pattern) for _, regex in regexes),
+                           re.IGNORECASE)
+    return prefilter, regexes
+
+#------------------------------------------------------------------------------
+
+class thunter():
+
+    def __init__(self, patterns_filename, hits_filename, compress=None):
+        patterns = load_patterns(patterns_filename)
+        assert patterns, 'no patterns in {}'.format(patterns_filename)
+        self._prefilter, self._regexes = compile_patterns(patterns)
+        logger.info('hunting %d patterns', len(patterns))
+        self._fo = toutput.open_output(hits_filename, compress)
+        self._writer = csv.writer(self._fo, lineterminator='\n')
+        self._writer.writerow(HITS_FIELDS)
+        self._hits = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    def scan(self, mid, dialog, text_fields):
+        search = self._prefilter.search
+        for field, text in text_fields:
+            if not isinstance(text, str) or not search(text):
+                continue
+            hits = []
+            for index, (pattern, regex) in enumerate(self._regexes):
+                for match in regex.finditer(text):
+                    if match.start() != match.end():
+                        hits.append((match.start(), index, match.end(),
+                                     pattern, match.group()))
+            # In text order, as a single scan.
+            hits.sort()
+            for start, _, end, pattern, group in hits:
+                self._writer.writerow(
+                    (mid, dialog, field, pattern, start, end, group))
+            self._hits += len(hits)
+
+    def close(self):
+        if self._fo:
+            self._fo.close()
+            self._fo = None
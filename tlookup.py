@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, random access lookups.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Random access to a cache4.db: single messages, users, chats and dialogs
+decoded on demand, without parsing the whole database.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import sqlite3
+
+import tblob
+import tdb
+
+#------------------------------------------------------------------------------
+
+class tlookup():
+
+    # Each lookup is an indexed SELECT by primary key and decodes that row
+    # only. The names in the rows (senders, recipients, dialogs) are resolved
+    # by the lookup tables of tdb, which keep the last users and chats used.
+
+    def __init__(self, infilename, cache_size=tdb.LOOKUP_CACHE_SIZE,
+                 blob_parser=None):
+        db_uri = 'file:' + infilename + '?mode=ro'
+        self._db_connection = sqlite3.connect(db_uri, uri=True)
+        self._db_connection.text_factory = bytes
+        self._db_connection.row_factory = sqlite3.Row
+        self._blob_parser = blob_parser if blob_parser else tblob.tblob()
+        self._tdb = tdb.tdb(None, self._blob_parser,
+                            self._db_connection.cursor())
+        self._tdb.use_lookup_tables(cache_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._db_connection.close()
+
+    @property
+    def blob_parser(self):
+        return self._blob_parser
+
+    def __lookup(self, table, key_column, key, from_entry):
+        entry = self._tdb.select_entry(table, key_column, key)
+        return from_entry(entry) if entry else None
+
+    def chat(self, uid):
+        return self.__lookup('chats', 'uid', uid, self._tdb.chat_from_entry)
+
+    def dialog(self, did):
+        return self.__lookup('dialogs', 'did', did,
+                             self._tdb.dialog_from_entry)
+
+    def message(self, mid):
+        return self.__lookup('messages', 'mid', mid,
+                             self._tdb.message_from_entry)
+
+    def user(self, uid):
+        return self.__lookup('users', 'uid', uid, self._tdb.user_from_entry)
+
+    def dialog_row(self, did):
+        # The timeline row (trow), names resolved.
+        dialog = self.dialog(did)
+        return self._tdb.dialog_to_row(did, dialog) if dialog else None
+
+    def message_row(self, mid):
+        # The timeline row (trow), names resolved.
+        message = self.message(mid)
+        return self._tdb.message_to_row(mid, message) if message else None
+
+    def user_row(self, uid):
+        user = self.user(uid)
+        return self._tdb.user_to_row(uid, user) if user else None
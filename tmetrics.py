@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, phases instrumentation.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Wall time, CPU time and throughput of the parsing phases.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import contextlib
+import json
+import time
+
+#------------------------------------------------------------------------------
+
+METRICS_FILENAME = 'metrics.json'
+
+#------------------------------------------------------------------------------
+
+class tphase():
+
+    __slots__ = ('name', 'wall', 'cpu', 'rows', 'bytes_read')
+
+    def __init__(self, name):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rows = 0
+        self.bytes_read = 0
+
+    @property
+    def rows_per_second(self):
+        if self.wall:
+            return self.rows / self.wall
+        return 0.0
+
+    def to_dict(self):
+        return {'name': self.name, 'wall': round(self.wall, 6),
+                'cpu': round(self.cpu, 6), 'rows': self.rows,
+                'bytes_read': self.bytes_read,
+                'rows_per_second': round(self.rows_per_second, 1)}
+
+#------------------------------------------------------------------------------
+
+class tmetrics():
+
+    def __init__(self):
+        self._phases = {}
+        self._current = None
+
+    @property
+    def phases(self):
+        return list(self._phases.values())
+
+    @property
+    def current(self):
+        # The phase being measured by phase(), None outside of it.
+        return self._current
+
+    def get(self, name):
+        if name not in self._phases:
+            self._phases[name] = tphase(name)
+        return self._phases[name]
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        phase = self.get(name)
+        previous = self._current
+        self._current = phase
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield phase
+        finally:
+            phase.cpu += time.process_time() - cpu
+            phase.wall += time.perf_counter() - wall
+            self._current = previous
+
+    def timed(self, name, iterable):
+        # Generators are consumed by the writers: only the time spent
+        # producing each item is accounted to the phase, not the writing.
+        phase = self.get(name)
+        iterator = iter(iterable)
+        while True:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                phase.cpu += time.process_time() - cpu
+                phase.wall += time.perf_counter() - wall
+            phase.rows += 1
+            yield item
+
+    def to_dict(self):
+        phases = [phase.to_dict() for phase in self._phases.values()]
+        return {'phases': phases}
+
+    def save(self, filename):
+        with open(filename, mode='w', encoding='utf-8') as fo:
+            json.dump(self.to_dict(), fo, indent=2)
+            fo.write('\n')
+
+    def summary(self):
+        lines = ['{:<32} {:>10} {:>10} {:>10} {:>12} {:>12}'.format(
+            'phase', 'wall (s)', 'cpu (s)', 'rows', 'bytes read', 'rows/s')]
+        for phase in self._phases.values():
+            lines.append('{:<32} {:>10.3f} {:>10.3f} {:>10} {:>12} {:>12.1f}'
+                         .format(phase.name, phase.wall, phase.cpu,
+                                 phase.rows, phase.bytes_read,
+                                 phase.rows_per_second))
+        return '\n'.join(lines)
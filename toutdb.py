@@ -0,0 +1,199 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, output database.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Telegram parser output SQLite database.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import os
+import sqlite3
+
+import logger
+
+#------------------------------------------------------------------------------
+
+DATABASE_NAME = 'teleparser.db'
+
+# Rows are buffered per table and inserted with executemany, everything is
+# loaded in a single transaction and the indexes are built at the end.
+BATCH_SIZE = 10000
+
+TABLES = {
+    'timeline': (
+        'timestamp TEXT', 'source TEXT', 'id INTEGER', 'type TEXT',
+        'from_who TEXT', 'from_id INTEGER', 'to_who TEXT', 'to_id INTEGER',
+        'dialog TEXT', 'dialog_type TEXT', 'content TEXT', 'media TEXT',
+        'extra TEXT', 'dialog_id INTEGER'),
+    'messages': (
+        'mid INTEGER PRIMARY KEY', 'uid INTEGER', 'dialog INTEGER',
+        'sequence INTEGER', 'date INTEGER', 'from_id INTEGER',
+        'to_id INTEGER', 'to_type TEXT', 'out INTEGER', 'read_state INTEGER',
+        'send_state INTEGER', 'ttl INTEGER', 'media INTEGER', 'imp INTEGER',
+        'mention INTEGER', 'type TEXT', 'content TEXT', 'media_info TEXT',
+        'reply_to_msg_id INTEGER', 'fwd_from_id INTEGER', 'views INTEGER',
+        'blob TEXT', 'blob_reply TEXT'),
+    'users': (
+        'uid INTEGER PRIMARY KEY', 'name TEXT', 'status INTEGER',
+        'username TEXT', 'first_name TEXT', 'last_name TEXT', 'phone TEXT',
+        'is_self INTEGER', 'blob TEXT'),
+    'chats': (
+        'uid INTEGER PRIMARY KEY', 'name TEXT', 'title TEXT',
+        'username TEXT', 'chat_type TEXT', 'creation_date INTEGER',
+        'blob TEXT'),
+    'dialogs': (
+        'did INTEGER PRIMARY KEY', 'date INTEGER', 'unread_count INTEGER',
+        'last_mid INTEGER', 'inbox_max INTEGER', 'outbox_max INTEGER',
+        'last_mid_i INTEGER', 'unread_count_i INTEGER', 'pts INTEGER',
+        'date_i INTEGER', 'pinned INTEGER', 'flags INTEGER'),
+    'media': (
+        'mid INTEGER PRIMARY KEY', 'uid INTEGER', 'date INTEGER',
+        'type INTEGER', 'media_info TEXT', 'blob TEXT')}
+
+INDEXES = (
+    'CREATE INDEX timeline_timestamp_idx ON timeline(timestamp)',
+    'CREATE INDEX timeline_dialog_idx ON timeline(dialog_id, timestamp)',
+    'CREATE INDEX timeline_from_idx ON timeline(from_id)',
+    'CREATE INDEX timeline_to_idx ON timeline(to_id)',
+    'CREATE INDEX messages_date_idx ON messages(date)',
+    'CREATE INDEX messages_dialog_idx ON messages(dialog, date)',
+    'CREATE INDEX messages_from_idx ON messages(from_id)',
+    'CREATE INDEX messages_to_idx ON messages(to_id)',
+    'CREATE INDEX media_uid_idx ON media(uid, date)',
+    'CREATE INDEX dialogs_date_idx ON dialogs(date)')
+
+# Full text index over the messages, contentless (rowid is the message mid,
+# join with 'messages' to get the row). Fields are the tdb.tmessage
+# text_fields names: webpage urls are not indexed here.
+FTS_TABLE = 'messages_fts'
+FTS_COLUMNS = ('text', 'caption', 'webpage_title', 'webpage_description',
+               'file_name')
+FTS_CREATE = (
+    "CREATE VIRTUAL TABLE {} USING fts5({}, content='', "
+    "tokenize='unicode61 remove_diacritics 2')".format(
+        FTS_TABLE, ', '.join(FTS_COLUMNS)))
+
+#------------------------------------------------------------------------------
+
+class toutdb():
+
+    def __init__(self, filename, batch_size=BATCH_SIZE):
+        if os.path.exists(filename):
+            os.remove(filename)
+        self._filename = filename
+        self._batch_size = batch_size
+        self._batches = {}
+        self._inserts = {}
+        self._connection = sqlite3.connect(filename, isolation_level=None)
+        self._cursor = self._connection.cursor()
+        self._cursor.execute('PRAGMA journal_mode=OFF')
+        self._cursor.execute('PRAGMA synchronous=OFF')
+        self._cursor.execute('PRAGMA cache_size=-262144')
+        for table, columns in TABLES.items():
+            self._cursor.execute('CREATE TABLE {}({})'.format(
+                table, ', '.join(columns)))
+            self._inserts[table] = 'INSERT INTO {} VALUES ({})'.format(
+                table, ', '.join('?' * len(columns)))
+            self._batches[table] = []
+        self._fts = self.__create_fts()
+        self._cursor.execute('BEGIN')
+
+    def __create_fts(self):
+        try:
+            self._cursor.execute(FTS_CREATE)
+        except sqlite3.OperationalError as ee:
+            logger.error('Unable to create the full text index (FTS5 not '
+                         'available?), skipping it. %s', str(ee))
+            return False
+        self._inserts[FTS_TABLE] = \
+            'INSERT INTO {}(rowid, {}) VALUES ({})'.format(
+                FTS_TABLE, ', '.join(FTS_COLUMNS),
+                ', '.join('?' * (len(FTS_COLUMNS) + 1)))
+        self._batches[FTS_TABLE] = []
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            self.abort()
+        else:
+            self.close()
+
+    def __flush(self, table):
+        batch = self._batches[table]
+        if batch:
+            self._cursor.executemany(self._inserts[table], batch)
+            batch.clear()
+
+    def insert(self, table, row):
+        batch = self._batches[table]
+        batch.append(row)
+        if len(batch) >= self._batch_size:
+            self.__flush(table)
+
+    def insert_many(self, table, rows):
+        for row in rows:
+            self.insert(table, row)
+
+    def insert_text(self, mid, text_fields):
+        if not self._fts or not text_fields:
+            return
+        values = dict.fromkeys(FTS_COLUMNS, None)
+        for field, text in text_fields:
+            if field not in values:
+                continue
+            if values[field]:
+                values[field] += ' ' + text
+            else:
+                values[field] = text
+        self.insert(FTS_TABLE, (mid,) + tuple(values.values()))
+
+    def close(self):
+        if not self._connection:
+            return
+        for table in self._batches:
+            self.__flush(table)
+        if self._fts:
+            self._cursor.execute(
+                "INSERT INTO {0}({0}) VALUES('optimize')".format(FTS_TABLE))
+        self._cursor.execute('COMMIT')
+        for statement in INDEXES:
+            self._cursor.execute(statement)
+        self._cursor.execute('ANALYZE')
+        self._connection.close()
+        self._connection = None
+
+    def abort(self):
+        # A failed run leaves no database that looks complete. Without the
+        # journal a ROLLBACK is not reliable: the file is removed.
+        if not self._connection:
+            return
+        self._connection.close()
+        self._connection = None
+        os.remove(self._filename)
+        logger.error('%s removed, the run did not complete', self._filename)
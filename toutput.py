@@ -0,0 +1,370 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, output writers.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Telegram parser output writers.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import base64
+import collections
+import csv
+import io
+import json
+import lzma
+import os
+import queue
+import threading
+import zlib
+
+#------------------------------------------------------------------------------
+
+# Output files are written through a large buffer, formatting is cheap enough
+# that the timeline generation should be bound by I/O.
+BUFFER_SIZE = 4 * 1024 * 1024
+
+FORMAT_TEXT = 'text'
+FORMAT_JSONL = 'jsonl'
+FORMAT_SQLITE = 'sqlite'
+FORMATS = (FORMAT_TEXT, FORMAT_JSONL, FORMAT_SQLITE)
+
+COMPRESS_GZIP = 'gzip'
+COMPRESS_XZ = 'xz'
+COMPRESSIONS = (COMPRESS_GZIP, COMPRESS_XZ)
+COMPRESS_EXTENSIONS = {COMPRESS_GZIP: '.gz', COMPRESS_XZ: '.xz'}
+
+# Number of buffers (BUFFER_SIZE each) queued to a compressing thread before
+# the writer blocks.
+COMPRESS_QUEUE_SIZE = 8
+
+# Number of records queued to a shard writing thread before blocking.
+SHARD_QUEUE_SIZE = 8192
+
+CSV_MODE_LEGACY = 'legacy'
+CSV_MODE_RFC4180 = 'rfc4180'
+CSV_MODES = (CSV_MODE_LEGACY, CSV_MODE_RFC4180)
+
+# Fields of a timeline tuple that the legacy mode escapes (content, media,
+# extra), see trow.fieldsnames().
+LEGACY_ESCAPED_FIELDS = (10, 11, 12)
+
+#------------------------------------------------------------------------------
+
+def escape_csv_string(instr):
+    if instr:
+        instr = instr.strip('"\'')
+        return '"{}"'.format(instr.replace('"', '\''))
+    return ''
+
+def to_json_value(value):
+    # Parsed blobs are construct Containers (dict) and ListContainers (list):
+    # private fields ('_io', '_signature', '_vector_sig', ...) are dropped and
+    # bytes are base64 encoded.
+    if isinstance(value, dict):
+        return {key: to_json_value(item) for key, item in value.items()
+                if not key.startswith('_')}
+    if isinstance(value, list):
+        return [to_json_value(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode('ascii')
+    return value
+
+def to_json_string(record):
+    return json.dumps(to_json_value(record), ensure_ascii=False,
+                      separators=(',', ':'))
+
+def to_json_line(record):
+    return to_json_string(record) + '\n'
+
+def write_jsonl(fo, records):
+    write = fo.write
+    for record in records:
+        write(to_json_line(record))
+
+def output_filename(path, compress=None):
+    if compress:
+        return path + COMPRESS_EXTENSIONS[compress]
+    return path
+
+def open_output(path, compress=None, newline='', append=False,
+                buffering=BUFFER_SIZE):
+    # newline='' is required by the csv module, the legacy writer emits its
+    # own '\n' terminators. With compress the extension is added to path,
+    # appending to a compressed file adds a new gzip member / xz stream.
+    if not compress:
+        return open(path, mode='a' if append else 'w', encoding='utf-8',
+                    newline=newline, buffering=buffering)
+    raw = tcompressed_writer(output_filename(path, compress), compress,
+                             append)
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffering),
+                            encoding='utf-8', newline=newline)
+
+#------------------------------------------------------------------------------
+
+class tcompressed_writer(io.RawIOBase):
+    # Raw sink compressing in its own thread: buffers are queued and the
+    # thread compresses and writes them, zlib and lzma release the GIL so
+    # compression overlaps with parsing. Output is a standard .gz (zlib with
+    # gzip header) or .xz stream, readable by zcat and xzcat.
+
+    def __init__(self, path, compress, append=False):
+        super().__init__()
+        assert compress in COMPRESSIONS
+        if compress == COMPRESS_GZIP:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        else:
+            self._compressor = lzma.LZMACompressor(lzma.FORMAT_XZ)
+        self._file = open(path, mode='ab' if append else 'wb')
+        self._queue = queue.Queue(COMPRESS_QUEUE_SIZE)
+        self._error = None
+        self._thread = threading.Thread(target=self.__run, daemon=True)
+        self._thread.start()
+
+    def __run(self):
+        compress = self._compressor.compress
+        write = self._file.write
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    break
+                write(compress(chunk))
+            write(self._compressor.flush())
+        except Exception as ee: # pylint: disable=W0703
+            self._error = ee
+            # Keep draining, the writer must never block on a dead thread.
+            while self._queue.get() is not None:
+                pass
+        finally:
+            self._file.close()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self._error:
+            raise self._error
+        data = bytes(b)
+        self._queue.put(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._queue.put(None)
+            self._thread.join()
+            super().close()
+            if self._error:
+                raise self._error
+
+#------------------------------------------------------------------------------
+
+class ttimeline_csv():
+    # Rows are tuples or objects exposing to_tuple() (see tdb.trow). The legacy
+    # mode reproduces the historical timeline.csv: only content, media and
+    # extra are quoted and double quotes inside them become apostrophes (data
+    # is altered!). The rfc4180 mode is a strict CSV made by the csv module.
+
+    def __init__(self, fo, fieldsnames, mode=CSV_MODE_LEGACY, separator=','):
+        assert mode in CSV_MODES
+        self._fo = fo
+        self._fieldsnames = fieldsnames
+        self._mode = mode
+        self._separator = separator
+        self._writer = None
+        self._line = None
+        self._line_writer = None
+        if mode == CSV_MODE_RFC4180:
+            self._writer = csv.writer(
+                fo, delimiter=separator, quoting=csv.QUOTE_MINIMAL,
+                lineterminator='\r\n')
+            self._line = io.StringIO()
+            self._line_writer = csv.writer(
+                self._line, delimiter=separator, quoting=csv.QUOTE_MINIMAL,
+                lineterminator='\r\n')
+
+    def header_line(self):
+        if self._line_writer:
+            return self.__csv_line(self._fieldsnames)
+        return self._separator.join(self._fieldsnames) + '\n'
+
+    def format_row(self, row):
+        # The row as a string, for writers not owning a file (e.g. shards).
+        if not isinstance(row, tuple):
+            row = row.to_tuple()
+        if self._line_writer:
+            return self.__csv_line(row)
+        return self.__legacy_line(row)
+
+    def write_header(self):
+        if self._writer:
+            self._writer.writerow(self._fieldsnames)
+        else:
+            self._fo.write(self._separator.join(self._fieldsnames))
+            self._fo.write('\n')
+
+    def write_row(self, row):
+        if not isinstance(row, tuple):
+            row = row.to_tuple()
+        if self._writer:
+            self._writer.writerow(row)
+        else:
+            self._fo.write(self.__legacy_line(row))
+
+    def write_rows(self, rows):
+        if self._writer:
+            self._writer.writerows(
+                row if isinstance(row, tuple) else row.to_tuple()
+                for row in rows)
+        else:
+            write = self._fo.write
+            legacy_line = self.__legacy_line
+            for row in rows:
+                if not isinstance(row, tuple):
+                    row = row.to_tuple()
+                write(legacy_line(row))
+
+    def __csv_line(self, values):
+        self._line.seek(0)
+        self._line.truncate()
+        self._line_writer.writerow(values)
+        return self._line.getvalue()
+
+    def __legacy_line(self, row):
+        values = [str(value) for value in row]
+        for index in LEGACY_ESCAPED_FIELDS:
+            values[index] = escape_csv_string(values[index])
+        return self._separator.join(values) + '\n'
+
+#------------------------------------------------------------------------------
+
+class ttimeline_jsonl():
+    # One JSON object per timeline row, keys are the fieldsnames and 'extra'
+    # is kept as an object.
+
+    def __init__(self, fo, fieldsnames):
+        self._fo = fo
+        self._fieldsnames = fieldsnames
+
+    def write_header(self):
+        pass
+
+    def header_line(self):
+        # pylint: disable=R0201
+        return ''
+
+    def format_row(self, row):
+        return self.__line(row)
+
+    def write_row(self, row):
+        self._fo.write(self.__line(row))
+
+    def write_rows(self, rows):
+        write = self._fo.write
+        for row in rows:
+            write(self.__line(row))
+
+    def __line(self, row):
+        if isinstance(row, tuple):
+            return to_json_line(dict(zip(self._fieldsnames, row)))
+        return to_json_line(row.to_dict())
+
+#------------------------------------------------------------------------------
+
+class tshard_writer():
+    # Text shards (files) in a directory, written by a pool of threads. A
+    # shard is always written by the same thread, so its records keep their
+    # order, and every thread keeps at most max_handles / workers files open
+    # (LRU): an evicted shard is reopened in append mode when needed again.
+    # Records are counted per shard, see counts.
+
+    def __init__(self, directory, workers=4, max_handles=64, compress=None):
+        assert workers > 0
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._compress = compress
+        self._counts = collections.Counter()
+        self._handles = max(1, max_handles // workers)
+        self._queues = []
+        self._threads = []
+        self._errors = []
+        for _ in range(workers):
+            shard_queue = queue.Queue(SHARD_QUEUE_SIZE)
+            thread = threading.Thread(
+                target=self.__run, args=(shard_queue,), daemon=True)
+            thread.start()
+            self._queues.append(shard_queue)
+            self._threads.append(thread)
+
+    @property
+    def counts(self):
+        return self._counts
+
+    def filename(self, name):
+        return output_filename(name, self._compress)
+
+    def write(self, name, header, text):
+        self._counts[name] += 1
+        self._queues[hash(name) % len(self._queues)].put((name, header, text))
+
+    def __run(self, shard_queue):
+        handles = collections.OrderedDict()
+        created = set()
+        try:
+            while True:
+                item = shard_queue.get()
+                if item is None:
+                    break
+                name, header, text = item
+                fo = handles.get(name, None)
+                if fo:
+                    handles.move_to_end(name)
+                else:
+                    if len(handles) >= self._handles:
+                        handles.popitem(last=False)[1].close()
+                    fo = open_output(
+                        os.path.join(self._directory, name), self._compress,
+                        append=name in created, buffering=64 * 1024)
+                    if name not in created:
+                        created.add(name)
+                        if header:
+                            fo.write(header)
+                    handles[name] = fo
+                fo.write(text)
+        except Exception as ee: # pylint: disable=W0703
+            self._errors.append(ee)
+            while shard_queue.get() is not None:
+                pass
+        finally:
+            for fo in handles.values():
+                fo.close()
+
+    def close(self):
+        for shard_queue in self._queues:
+            shard_queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
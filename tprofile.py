@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, cProfile and tracemalloc hooks.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Per phase CPU (cProfile) and memory (tracemalloc) profiling.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import contextlib
+import cProfile
+import os
+import tracemalloc
+
+import logger
+
+#------------------------------------------------------------------------------
+
+PROFILE_CPU = 'cpu'
+PROFILE_MEM = 'mem'
+PROFILES = (PROFILE_CPU, PROFILE_MEM)
+
+# Allocation sites listed in the memory reports.
+MEM_TOP = 25
+# Frames kept by tracemalloc for each allocation.
+MEM_FRAMES = 1
+
+#------------------------------------------------------------------------------
+
+class tprofile():
+
+    # Each phase gets its own dump in the output directory:
+    # profile_<phase>.pstats (cpu) or profile_<phase>_mem.txt (mem). Without
+    # a mode the phases are not profiled at all.
+
+    def __init__(self, mode, outdirectory, top=MEM_TOP):
+        assert mode in PROFILES or not mode
+        self._mode = mode
+        self._outdirectory = outdirectory
+        self._top = top
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if self._mode == PROFILE_CPU:
+            with self.__cpu(name):
+                yield
+        elif self._mode == PROFILE_MEM:
+            with self.__mem(name):
+                yield
+        else:
+            yield
+
+    @contextlib.contextmanager
+    def __cpu(self, name):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            filename = os.path.join(
+                self._outdirectory, 'profile_{}.pstats'.format(name))
+            profiler.dump_stats(filename)
+            logger.warning('cpu profile of phase %s saved in %s',
+                           name, filename)
+
+    @contextlib.contextmanager
+    def __mem(self, name):
+        started = tracemalloc.is_tracing()
+        if not started:
+            tracemalloc.start(MEM_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if not started:
+                tracemalloc.stop()
+            filename = os.path.join(
+                self._outdirectory, 'profile_{}_mem.txt'.format(name))
+            self.__save_mem_report(filename, name, before, after, current,
+                                   peak)
+            logger.warning('memory profile of phase %s saved in %s',
+                           name, filename)
+
+    def __save_mem_report(self, filename, name, before, after, current,
+                          peak):
+        # pylint: disable=R0913
+        differences = after.compare_to(before, 'lineno')
+        with open(filename, mode='w', encoding='utf-8') as fo:
+            fo.write('phase: {}\n'.format(name))
+            fo.write('traced memory at end: {} bytes\n'.format(current))
+            fo.write('traced memory peak: {} bytes\n'.format(peak))
+            fo.write('top {} allocation sites retained by the phase:\n'
+                     .format(self._top))
+            for difference in differences[:self._top]:
+                fo.write('{}\n'.format(difference))
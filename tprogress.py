@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, progress reporting.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Rows per second and ETA of the tables being parsed.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import sys
+import time
+
+#------------------------------------------------------------------------------
+
+# Seconds between two updates of the progress line.
+PROGRESS_INTERVAL = 0.5
+
+#------------------------------------------------------------------------------
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return '{:d}:{:02d}:{:02d}'.format(hours, minutes, seconds)
+
+#------------------------------------------------------------------------------
+
+class tprogress():
+
+    # One line per table, rewritten in place on a terminal. When the stream
+    # is not a terminal only the final line of each table is written.
+
+    def __init__(self, stream=None, interval=PROGRESS_INTERVAL):
+        self._stream = stream if stream else sys.stderr
+        self._interactive = self._stream.isatty()
+        self._interval = interval
+        self._name = None
+        self._total = 0
+        self._rows = 0
+        self._start = 0.0
+        self._next = 0.0
+        self._width = 0
+
+    def start(self, name, total):
+        self._name = name
+        self._total = total
+        self._rows = 0
+        self._start = time.perf_counter()
+        self._next = self._start + self._interval
+        self._width = 0
+
+    def update(self, rows=1):
+        self._rows += rows
+        if self._interactive:
+            now = time.perf_counter()
+            if now >= self._next:
+                self._next = now + self._interval
+                self.__write(now, '\r', False)
+
+    def finish(self):
+        if self._name is None:
+            return
+        self.__write(time.perf_counter(), '\r' if self._interactive else '',
+                     True)
+        self._stream.write('\n')
+        self._stream.flush()
+        self._name = None
+
+    def __write(self, now, prefix, done):
+        elapsed = now - self._start
+        rate = self._rows / elapsed if elapsed else 0.0
+        # The total can be an estimate, never go beyond 100%.
+        total = max(self._total, self._rows)
+        percent = 100.0 * self._rows / total if total else 100.0
+        if not done and self._rows < total:
+            eta = 'ETA {}'.format(format_seconds((total - self._rows) / rate)
+                                  if rate else '?')
+        else:
+            eta = 'in {}'.format(format_seconds(elapsed))
+        line = '{}: {}/{} rows {:5.1f}% {:.0f} rows/s {}'.format(
+            self._name, self._rows, total, percent, rate, eta)
+        # Clear what is left of a longer previous line.
+        padding = ' ' * max(0, self._width - len(line))
+        self._width = len(line)
+        self._stream.write(prefix + line + padding)
+        self._stream.flush()
@@ -0,0 +1,575 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, synthetic database generator.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Synthetic Telegram cache4.db generator, for tests and benchmarks.'''
+
+# pylint: disable=C0103,C0115,C0116,R0902,R0913,R0914
+
+import argparse
+import itertools
+import os
+import random
+import sqlite3
+import struct
+
+#------------------------------------------------------------------------------
+
+VECTOR_SIGNATURE = 0x1cb5c415
+
+# Per version table layouts, blobs are the same (the newest constructors
+# tblob knows), what changes are the tables columns.
+SCHEMA_COMMON = (
+    'CREATE TABLE users(uid INTEGER PRIMARY KEY, name TEXT, status INTEGER, '
+    'data BLOB)',
+    'CREATE TABLE chats(uid INTEGER PRIMARY KEY, name TEXT, data BLOB)',
+    'CREATE TABLE contacts(uid INTEGER PRIMARY KEY, mutual INTEGER)',
+    'CREATE TABLE enc_chats(uid INTEGER PRIMARY KEY, user INTEGER, '
+    'name TEXT, data BLOB, g BLOB, authkey BLOB, ttl INTEGER, '
+    'layer INTEGER, seq_in INTEGER, seq_out INTEGER, use_count INTEGER, '
+    'exchange_id INTEGER, key_date INTEGER, fprint INTEGER, fauthkey BLOB, '
+    'khash BLOB, in_seq_no INTEGER, admin_id INTEGER, mtproto_seq INTEGER)',
+    'CREATE TABLE media_v2(mid INTEGER PRIMARY KEY, uid INTEGER, '
+    'date INTEGER, type INTEGER, data BLOB)',
+    'CREATE TABLE messages(mid INTEGER PRIMARY KEY, uid INTEGER, '
+    'read_state INTEGER, send_state INTEGER, date INTEGER, data BLOB, '
+    'out INTEGER, ttl INTEGER, media INTEGER, replydata BLOB, imp INTEGER, '
+    'mention INTEGER)',
+    'CREATE TABLE sent_files_v2(uid TEXT, type INTEGER, data BLOB, '
+    'parent TEXT, PRIMARY KEY (uid, type))',
+    'CREATE TABLE user_settings(uid INTEGER PRIMARY KEY, info BLOB, '
+    'pinned INTEGER)',
+    'CREATE INDEX uid_mid_idx_messages ON messages(uid, mid)',
+    'CREATE INDEX uid_date_mid_idx_messages ON messages(uid, date, mid)',
+    'CREATE INDEX uid_mid_type_date_idx_media ON media_v2(uid, mid, type, '
+    'date)')
+
+SCHEMA_DIALOGS_5 = (
+    'CREATE TABLE dialogs(did INTEGER PRIMARY KEY, date INTEGER, '
+    'unread_count INTEGER, last_mid INTEGER, inbox_max INTEGER, '
+    'outbox_max INTEGER, last_mid_i INTEGER, unread_count_i INTEGER, '
+    'pts INTEGER, date_i INTEGER, pinned INTEGER, flags INTEGER)')
+
+SCHEMA_DIALOGS_6 = (
+    'CREATE TABLE dialogs(did INTEGER PRIMARY KEY, date INTEGER, '
+    'unread_count INTEGER, last_mid INTEGER, inbox_max INTEGER, '
+    'outbox_max INTEGER, last_mid_i INTEGER, unread_count_i INTEGER, '
+    'pts INTEGER, date_i INTEGER, pinned INTEGER, flags INTEGER, '
+    'folder_id INTEGER, data BLOB)')
+
+SCHEMAS = {
+    '5.5.0': SCHEMA_COMMON + (SCHEMA_DIALOGS_5,),
+    '5.6.2': SCHEMA_COMMON + (SCHEMA_DIALOGS_5,),
+    '5.15.0': SCHEMA_COMMON + (SCHEMA_DIALOGS_6,),
+    '6.3.0': SCHEMA_COMMON + (SCHEMA_DIALOGS_6,)}
+
+# Default message type mix, relative weights.
+DEFAULT_MIX = {
+    'text': 60, 'photo': 10, 'document': 8, 'webpage': 6, 'forward': 6,
+    'reply': 6, 'service': 4}
+
+WORDS = (
+    'alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel',
+    'india', 'juliett', 'kilo', 'lima', 'mike', 'november', 'oscar', 'papa',
+    'quebec', 'romeo', 'sierra', 'tango', 'uniform', 'victor', 'whiskey',
+    'xray', 'yankee', 'zulu', 'ciao', 'привет', 'γεια', '你好', '"quoted"',
+    "it's", 'comma,separated')
+
+BASE_EPOCH = 1577836800 # 2020-01-01
+
+#------------------------------------------------------------------------------
+# TL serialization helpers
+
+def tl_int32(value):
+    return struct.pack('<I', value & 0xFFFFFFFF)
+
+def tl_int64(value):
+    return struct.pack('<Q', value & 0xFFFFFFFFFFFFFFFF)
+
+def tl_bytes(value):
+    length = len(value)
+    if length <= 253:
+        data = bytes((length,)) + value
+    else:
+        data = b'\xfe' + length.to_bytes(3, 'little') + value
+    if len(data) % 4:
+        data += b'\x00' * (4 - len(data) % 4)
+    return data
+
+def tl_string(value):
+    return tl_bytes(value.encode('utf-8'))
+
+def tl_vector(items):
+    return tl_int32(VECTOR_SIGNATURE) + tl_int32(len(items)) + b''.join(items)
+
+def tl_int32_vector(values):
+    return tl_vector([tl_int32(value) for value in values])
+
+#------------------------------------------------------------------------------
+# Constructors, see the matching *_struct methods in tblob.
+
+def file_location(volume_id, local_id):
+    return tl_int32(0xbc7fc6cd) + tl_int64(volume_id) + tl_int32(local_id)
+
+def user_profile_photo(photo_id, volume_id):
+    return (tl_int32(0x69d3ab26) + tl_int32(0) + tl_int64(photo_id) +
+            file_location(volume_id, 1) + file_location(volume_id, 2) +
+            tl_int32(2))
+
+def user_status_recently():
+    return tl_int32(0xe26f42f1)
+
+def user(uid, first_name, last_name, username, phone, is_self=False,
+         contact=False, mutual=False, photo_id=None):
+    flags = 1 | 64
+    payload = tl_int64(uid * 7919)
+    if first_name:
+        flags |= 2
+        payload += tl_string(first_name)
+    if last_name:
+        flags |= 4
+        payload += tl_string(last_name)
+    if username:
+        flags |= 8
+        payload += tl_string(username)
+    if phone:
+        flags |= 16
+        payload += tl_string(phone)
+    if photo_id:
+        flags |= 32
+        payload += user_profile_photo(photo_id, photo_id + 1)
+    payload += user_status_recently()
+    if is_self:
+        flags |= 1024
+    if contact:
+        flags |= 2048
+    if mutual:
+        flags |= 4096
+    return tl_int32(0x938458c1) + tl_int32(flags) + tl_int32(uid) + payload
+
+def chat_photo(volume_id):
+    if not volume_id:
+        return tl_int32(0x37c1011c)
+    return (tl_int32(0xd20b9f3c) + tl_int32(0) +
+            file_location(volume_id, 1) + file_location(volume_id, 2) +
+            tl_int32(2))
+
+def channel(cid, title, username, date, megagroup=False, creator=False,
+            participants=None, volume_id=None):
+    flags = 8192
+    if creator:
+        flags |= 1
+    if megagroup:
+        flags |= 256
+    else:
+        flags |= 32
+    if username:
+        flags |= 64
+    if participants:
+        flags |= 131072
+    data = tl_int32(0xd31a961e) + tl_int32(flags) + tl_int32(cid)
+    data += tl_int64(cid * 104729)
+    data += tl_string(title)
+    if username:
+        data += tl_string(username)
+    data += chat_photo(volume_id)
+    data += tl_int32(date) + tl_int32(0)
+    if participants:
+        data += tl_int32(participants)
+    return data
+
+def encrypted_chat(ecid, date, admin_id, participant_id):
+    return (tl_int32(0xfa56ce36) + tl_int32(ecid) + tl_int64(ecid * 31) +
+            tl_int32(date) + tl_int32(admin_id) + tl_int32(participant_id) +
+            tl_bytes(bytes(range(32))) + tl_int64(ecid * 17))
+
+def photo_size(size_type, volume_id, local_id, width, height, size):
+    return (tl_int32(0x77bfb61b) + tl_string(size_type) +
+            file_location(volume_id, local_id) + tl_int32(width) +
+            tl_int32(height) + tl_int32(size))
+
+def photo(pid, date):
+    sizes = [photo_size('s', pid, 1, 90, 60, 1200),
+             photo_size('x', pid, 2, 800, 600, 65000)]
+    return (tl_int32(0xfb197a65) + tl_int32(0) + tl_int64(pid) +
+            tl_int64(pid * 3) + tl_bytes(b'\x01' * 8) + tl_int32(date) +
+            tl_vector(sizes) + tl_int32(2))
+
+def document(did, date, mime_type, size, file_name):
+    attributes = [tl_int32(0x15590068) + tl_string(file_name)]
+    return (tl_int32(0x1e87342b) + tl_int32(0) + tl_int64(did) +
+            tl_int64(did * 3) + tl_bytes(b'\x02' * 8) + tl_int32(date) +
+            tl_string(mime_type) + tl_int32(size) + tl_int32(2) +
+            tl_vector(attributes))
+
+def web_page(wid, url, title, description):
+    flags = 4 | 8
+    return (tl_int32(0xe89c45b2) + tl_int32(flags) + tl_int64(wid) +
+            tl_string(url) + tl_string(url.split('//', 1)[-1]) +
+            tl_int32(0) + tl_string(title) + tl_string(description))
+
+def message_media_photo(pid, date):
+    return tl_int32(0x695150d7) + tl_int32(1) + photo(pid, date)
+
+def message_media_document(did, date, mime_type, size, file_name):
+    return (tl_int32(0x9cb070d7) + tl_int32(1) +
+            document(did, date, mime_type, size, file_name))
+
+def message_media_web_page(wid, url, title, description):
+    return tl_int32(0xa32dd600) + web_page(wid, url, title, description)
+
+def text_plain(text):
+    return tl_int32(0x744694e0) + tl_string(text)
+
+def text_bold(rich_text):
+    return tl_int32(0x6724abc4) + rich_text
+
+def text_url(rich_text, url, webpage_id=0):
+    return tl_int32(0x3c2884c1) + rich_text + tl_string(url) + \
+        tl_int64(webpage_id)
+
+def text_concat(rich_texts):
+    return tl_int32(0x7e6260d7) + tl_vector(rich_texts)
+
+def page_block_title(rich_text):
+    return tl_int32(0x70abc3fd) + rich_text
+
+def page_block_header(rich_text):
+    return tl_int32(0xbfd064ec) + rich_text
+
+def page_block_paragraph(rich_text):
+    return tl_int32(0x467a0766) + rich_text
+
+def page_block_list(rich_texts):
+    return tl_int32(0xe4e88011) + tl_vector(
+        [tl_int32(0xb92fb6cd) + rich_text for rich_text in rich_texts])
+
+def peer_user(uid):
+    return tl_int32(0x9db1bc6d) + tl_int32(uid)
+
+def peer_channel(cid):
+    return tl_int32(0xbddde532) + tl_int32(cid)
+
+def message_fwd_header(from_id, date):
+    return tl_int32(0x353a686b) + tl_int32(1) + tl_int32(from_id) + \
+        tl_int32(date)
+
+def message_entity(offset, length, url=False):
+    signature = 0x6ed02538 if url else 0xbd610bc9
+    return tl_int32(signature) + tl_int32(offset) + tl_int32(length)
+
+def message(msg_id, from_id, to_peer, date, text, media=None, fwd=None,
+            reply_to=None, entities=None, views=None, out=False):
+    flags = 0
+    if out:
+        flags |= 2
+    if fwd:
+        flags |= 4
+    if reply_to:
+        flags |= 8
+    if entities:
+        flags |= 128
+    if from_id:
+        flags |= 256
+    if media:
+        flags |= 512
+    if views:
+        flags |= 1024
+    data = tl_int32(0x452c0e65) + tl_int32(flags) + tl_int32(msg_id)
+    if from_id:
+        data += tl_int32(from_id)
+    data += to_peer
+    if fwd:
+        data += fwd
+    if reply_to:
+        data += tl_int32(reply_to)
+    data += tl_int32(date) + tl_string(text)
+    if media:
+        data += media
+    if entities:
+        data += tl_vector(entities)
+    if views:
+        data += tl_int32(views)
+    return data
+
+def message_service_channel_create(msg_id, from_id, cid, date, title):
+    return (tl_int32(0x9e19a1f6) + tl_int32(256) + tl_int32(msg_id) +
+            tl_int32(from_id) + peer_channel(cid) + tl_int32(date) +
+            tl_int32(0x95d2ac92) + tl_string(title))
+
+def user_full(user_blob):
+    return (tl_int32(0xedf17c12) + tl_int32(0) + user_blob +
+            tl_int32(0x733f2961) + tl_int32(0) +
+            tl_int32(0xaf509d20) + tl_int32(0) + tl_int32(0))
+
+#------------------------------------------------------------------------------
+
+class tsynth():
+
+    def __init__(self, messages=10000, users=None, channels=None,
+                 enc_chats=None, mix=None, seed=0, version='6.3.0'):
+        assert version in SCHEMAS
+        self._messages = messages
+        self._users = users or max(10, min(messages // 100, 50000))
+        self._channels = channels or max(2, min(messages // 1000, 5000))
+        self._enc_chats = enc_chats or max(1, min(messages // 5000, 500))
+        mix = mix or DEFAULT_MIX
+        self._kinds = list(mix)
+        self._weights = list(itertools.accumulate(mix[kind]
+                                                  for kind in self._kinds))
+        self._random = random.Random(seed)
+        self._version = version
+        self._self_uid = 100000
+
+    @property
+    def user_ids(self):
+        return range(self._self_uid, self._self_uid + self._users)
+
+    @property
+    def channel_ids(self):
+        return range(1000000, 1000000 + self._channels)
+
+    def __text(self, words_min=1, words_max=12):
+        rnd = self._random
+        return ' '.join(rnd.choice(WORDS)
+                        for _ in range(rnd.randint(words_min, words_max)))
+
+    def __users_rows(self):
+        for index, uid in enumerate(self.user_ids):
+            first = 'first{}'.format(index)
+            last = 'last{}'.format(index) if index % 3 else ''
+            username = 'user{}'.format(index) if index % 2 else ''
+            phone = '39{:010d}'.format(uid) if index % 4 == 0 else ''
+            photo_id = uid * 1000 if index % 5 == 0 else None
+            blob = user(uid, first, last, username, phone,
+                        is_self=(uid == self._self_uid),
+                        contact=(index % 2 == 0), mutual=(index % 6 == 0),
+                        photo_id=photo_id)
+            name = '{} {};;;{}'.format(first, last, username).lower()
+            yield (uid, name, BASE_EPOCH + index, blob)
+
+    def __chats_rows(self):
+        for index, cid in enumerate(self.channel_ids):
+            title = 'channel {} {}'.format(index, self.__text(1, 3))
+            username = 'chan{}'.format(index) if index % 2 else ''
+            blob = channel(cid, title, username, BASE_EPOCH - index * 3600,
+                           megagroup=bool(index % 3), creator=(index == 0),
+                           participants=index * 10 + 2,
+                           volume_id=cid * 10 if index % 4 else None)
+            yield (cid, title.lower(), blob)
+
+    def __enc_chats_rows(self):
+        users = list(self.user_ids)[1:]
+        for index in range(self._enc_chats):
+            ecid = 5000 + index
+            participant = users[index % len(users)]
+            blob = encrypted_chat(ecid, BASE_EPOCH + index * 60,
+                                  self._self_uid, participant)
+            yield (ecid, participant, 'secret {}'.format(index), blob,
+                   b'\x02', bytes(256), 3600, 73, index, index, 0, 0,
+                   BASE_EPOCH + index * 120, ecid * 17, b'', bytes(16), 0,
+                   self._self_uid, 0)
+
+    def __message_media(self, kind, msg_id, date):
+        rnd = self._random
+        if kind == 'photo':
+            return message_media_photo(msg_id * 10 + 1, date), 1
+        if kind == 'document':
+            name = 'file_{}.{}'.format(msg_id, rnd.choice(('pdf', 'zip')))
+            return message_media_document(
+                msg_id * 10 + 2, date, 'application/octet-stream',
+                rnd.randint(1000, 10000000), name), 2
+        if kind == 'webpage':
+            url = 'https://example.org/{}'.format(msg_id)
+            return message_media_web_page(
+                msg_id * 10 + 3, url, self.__text(2, 5),
+                self.__text(5, 20)), 3
+        return None, 0
+
+    def __pick_kind(self):
+        return self._random.choices(self._kinds,
+                                    cum_weights=self._weights)[0]
+
+    def __messages_rows(self):
+        # Messages are spread over 1-1 dialogs with users and channels: in
+        # channels the mid has the channel id in the upper 32 bits and the
+        # dialog (uid) is the negative channel id.
+        rnd = self._random
+        users = list(self.user_ids)[1:]
+        channels = list(self.channel_ids)
+        sequences = {}
+        last_blob = {}
+        for index in range(self._messages):
+            date = BASE_EPOCH + index * 30
+            if channels and rnd.random() < 0.5:
+                cid = rnd.choice(channels)
+                dialog = -cid
+                to_peer = peer_channel(cid)
+                from_id = rnd.choice(users) if cid % 3 else None
+            else:
+                dialog = rnd.choice(users)
+                to_peer = peer_user(dialog)
+                from_id = rnd.choice((self._self_uid, dialog))
+            if dialog < 0:
+                msg_id = sequences.get(dialog, 0) + 1
+                sequences[dialog] = msg_id
+                mid = (-dialog << 32) | msg_id
+            else:
+                msg_id = mid = index + 1
+            out = int(from_id == self._self_uid)
+            kind = self.__pick_kind()
+
+            if kind == 'service':
+                if dialog > 0:
+                    kind = 'text'
+                else:
+                    blob = message_service_channel_create(
+                        msg_id, from_id or self._self_uid, -dialog, date,
+                        'created {}'.format(-dialog))
+                    yield (mid, dialog, 1, 0, date, blob, out, 0, 0, None,
+                           0, 0), None
+                    continue
+
+            media, media_type = self.__message_media(kind, msg_id, date)
+            text = self.__text()
+            entities = None
+            if rnd.random() < 0.1:
+                entities = [message_entity(0, min(len(text), 5)),
+                            message_entity(0, 3, url=True)]
+            fwd = None
+            if kind == 'forward':
+                fwd = message_fwd_header(rnd.choice(users), date - 86400)
+            replydata = None
+            reply_to = None
+            if kind == 'reply' and dialog in last_blob:
+                reply_to, replydata = last_blob[dialog]
+            views = rnd.randint(1, 100000) if dialog < 0 else None
+            blob = message(msg_id, from_id, to_peer, date, text, media, fwd,
+                           reply_to, entities, views, out)
+            last_blob[dialog] = (msg_id, blob)
+            row = (mid, dialog, 1, 0, date, blob, out, 0, int(bool(media)),
+                   replydata, 0, 0)
+            media_row = None
+            if media:
+                media_row = (mid, dialog, date, media_type, blob)
+            yield row, media_row
+
+    def generate(self, outfilename, batch=10000):
+        if os.path.exists(outfilename):
+            os.remove(outfilename)
+        connection = sqlite3.connect(outfilename)
+        cursor = connection.cursor()
+        cursor.execute('PRAGMA journal_mode=OFF')
+        cursor.execute('PRAGMA synchronous=OFF')
+        for statement in SCHEMAS[self._version]:
+            cursor.execute(statement)
+
+        cursor.executemany('INSERT INTO users VALUES (?,?,?,?)',
+                           self.__users_rows())
+        cursor.executemany('INSERT INTO contacts VALUES (?,?)',
+                           ((uid, int(index % 6 == 0))
+                            for index, uid in enumerate(self.user_ids)
+                            if index % 2 == 0 and uid != self._self_uid))
+        self_blob = next(self.__users_rows())[3]
+        cursor.execute('INSERT INTO user_settings VALUES (?,?,?)',
+                       (self._self_uid, user_full(self_blob), 0))
+        cursor.executemany('INSERT INTO chats VALUES (?,?,?)',
+                           self.__chats_rows())
+        cursor.executemany(
+            'INSERT INTO enc_chats VALUES '
+            '(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)',
+            self.__enc_chats_rows())
+
+        dialogs = {}
+        messages = []
+        media = []
+        for row, media_row in self.__messages_rows():
+            messages.append(row)
+            if media_row:
+                media.append(media_row)
+            mid, dialog, date = row[0], row[1], row[4]
+            dialogs[dialog] = (date, mid)
+            if len(messages) >= batch:
+                self.__insert_messages(cursor, messages, media)
+                messages, media = [], []
+        self.__insert_messages(cursor, messages, media)
+
+        dialogs_columns = 14 if self._version.startswith(('5.15', '6.')) \
+            else 12
+        for ecid in range(5000, 5000 + self._enc_chats):
+            dialogs[ecid << 32] = (BASE_EPOCH, 0)
+        cursor.executemany(
+            'INSERT INTO dialogs VALUES ({})'.format(
+                ','.join('?' * dialogs_columns)),
+            ((did, date, 0, mid, mid & 0xFFFFFFFF, mid & 0xFFFFFFFF, mid,
+              0, 1, date, 0, 0, 0, None)[:dialogs_columns]
+             for did, (date, mid) in dialogs.items()))
+
+        cursor.execute('INSERT INTO sent_files_v2 VALUES (?,?,?,?)',
+                       ('/sdcard/DCIM/photo.jpg', 1,
+                        message_media_photo(1, BASE_EPOCH), None))
+        connection.commit()
+        connection.close()
+
+    @staticmethod
+    def __insert_messages(cursor, messages, media):
+        cursor.executemany(
+            'INSERT INTO messages VALUES (?,?,?,?,?,?,?,?,?,?,?,?)', messages)
+        cursor.executemany('INSERT INTO media_v2 VALUES (?,?,?,?,?)', media)
+
+#------------------------------------------------------------------------------
+
+def parse_mix(mix_string):
+    mix = {}
+    for item in mix_string.split(','):
+        kind, weight = item.split('=')
+        if kind not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                'unknown message type {}'.format(kind))
+        mix[kind] = int(weight)
+    return mix
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description='Synthetic Telegram cache4.db generator')
+    parser.add_argument('outfilename', help='output cache4.db, overwritten')
+    parser.add_argument('-m', '--messages', type=int, default=10000,
+                        help='number of messages (default 10000)')
+    parser.add_argument('--users', type=int, help='number of users')
+    parser.add_argument('--channels', type=int, help='number of channels')
+    parser.add_argument('--enc-chats', type=int,
+                        help='number of secret chats')
+    parser.add_argument('--mix', type=parse_mix,
+                        help='message types weights, e.g. text=80,photo=20 '
+                        '(types: {})'.format(', '.join(DEFAULT_MIX)))
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--version', choices=sorted(SCHEMAS),
+                        default='6.3.0', help='tables layout')
+    args = parser.parse_args()
+
+    tsynth(args.messages, args.users, args.channels, args.enc_chats,
+           args.mix, args.seed, args.version).generate(args.outfilename)
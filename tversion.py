@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Telegram cache4 db parser, Telegram version detection.
+#
+# Released under MIT License
+#
+# Copyright (c) 2019 Francesco "dfirfpi" Picasso, Reality Net System Solutions
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+'''Telegram app version detection by blobs signatures sampling.'''
+
+# pylint: disable=C0103,C0115,C0116
+
+import glob
+import os
+import re
+import sqlite3
+import struct
+
+import logger
+import tcensus
+
+#------------------------------------------------------------------------------
+
+# The utils/tds_<version>.txt files list the constructors of each app version,
+# as produced by utils/build_callbacks.py.
+TDS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'utils')
+TDS_PATTERN = 'tds_[0-9]*.txt'
+
+# Rows sampled per blob column, half from the oldest and half from the newest
+# rows: the db keeps the blobs written by the previous app versions.
+SAMPLE_ROWS = 300
+
+# Not version specific, even if some lists miss them.
+GENERIC_SIGNATURES = frozenset((
+    0x1cb5c415,  # vector
+))
+
+#------------------------------------------------------------------------------
+
+def version_key(version):
+    return tuple(int(part) for part in version.split('.'))
+
+def load_versions(directory=TDS_DIRECTORY):
+    # {version: set of signatures}
+    versions = {}
+    signature_re = re.compile(r'^(0x[0-9a-fA-F]{8})\s*:', re.MULTILINE)
+    for filename in glob.glob(os.path.join(directory, TDS_PATTERN)):
+        version = os.path.basename(filename)[len('tds_'):-len('.txt')]
+        with open(filename, mode='r', encoding='utf-8') as fi:
+            versions[version] = {int(match.group(1), 16) for match
+                                 in signature_re.finditer(fi.read())}
+    return versions
+
+def blob_signatures(data, known):
+    # TL objects are 4 bytes aligned: every aligned int32 that is a known
+    # constructor is taken as a (top-level or nested) signature.
+    aligned = len(data) - len(data) % 4
+    return {value for (value,) in struct.iter_unpack('<I', data[:aligned])
+            if value in known}
+
+#------------------------------------------------------------------------------
+
+class tversion():
+
+    def __init__(self, sqlite_db_cursor, versions=None,
+                 sample_rows=SAMPLE_ROWS):
+        assert sqlite_db_cursor
+        self._sqlite_db_cursor = sqlite_db_cursor
+        self._versions = versions if versions else load_versions()
+        assert self._versions
+        self._sample_rows = sample_rows
+        self._known = (set().union(*self._versions.values()) -
+                       GENERIC_SIGNATURES)
+        self._observed = {}
+        self._scores = {}
+
+    @property
+    def observed(self):
+        # {signature: number of sampled blobs containing it}
+        return self._observed
+
+    @property
+    def scores(self):
+        # {version: observed signatures missing in the version}
+        return self._scores
+
+    def __sample(self, table, column):
+        half = max(1, self._sample_rows // 2)
+        query = ('SELECT {0} FROM {1} WHERE {0} IS NOT NULL '
+                 'ORDER BY rowid {2} LIMIT {3}')
+        rows = []
+        for order in ('ASC', 'DESC'):
+            self._sqlite_db_cursor.execute(
+                query.format(column, table, order, half))
+            rows.extend(self._sqlite_db_cursor.fetchall())
+        return rows
+
+    def detect(self):
+        self._observed = {}
+        for table, column in tcensus.BLOB_COLUMNS:
+            try:
+                rows = self.__sample(table, column)
+            except sqlite3.OperationalError as ee:
+                logger.warning('version sampling of %s.%s skipped: %s',
+                               table, column, str(ee))
+                continue
+            for row in rows:
+                for signature in blob_signatures(bytes(row[0]), self._known):
+                    self._observed[signature] = (
+                        self._observed.get(signature, 0) + 1)
+        self._scores = {
+            version: len(self._observed.keys() - signatures)
+            for version, signatures in self._versions.items()}
+        return self.best_versions
+
+    @property
+    def best_versions(self):
+        # The versions knowing the most of the observed signatures, sorted.
+        if not self._scores:
+            return []
+        best = min(self._scores.values())
+        return sorted((version for version, missing in self._scores.items()
+                       if missing == best), key=version_key)
+
+    @property
+    def version_range(self):
+        best = self.best_versions
+        if not best:
+            return None, None
+        return best[0], best[-1]
+
+    def signatures(self, versions=None):
+        # Signatures of the given versions (default the best ones).
+        if versions is None:
+            versions = self.best_versions
+        return set().union(*(self._versions[version] for version in versions))
+
+    def report(self):
+        lines = ['{} signatures observed'.format(len(self._observed))]
+        for version in sorted(self._scores, key=version_key):
+            lines.append('{:<10} {:>5} observed signatures missing'.format(
+                version, self._scores[version]))
+        lines.append('most likely version(s): {}'.format(
+            ', '.join(self.best_versions)))
+        return '\n'.join(lines)